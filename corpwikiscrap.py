@@ -4,20 +4,62 @@ With Processed/Unprocessed tracking (CORRECTED)
 """
 
 import asyncio
+import argparse
 import time
 import csv
 import os
-from playwright.async_api import async_playwright
-from urllib.parse import urljoin
+import io
+import gzip
+import tarfile
+import json
+import signal
+import random
+import sqlite3
+import threading
+import subprocess
+import sys
+import zlib
+import bisect
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, quote_plus
 import logging
-from bs4 import BeautifulSoup
+import logging.handlers
+import queue
+import atexit
 import re
+import difflib
+import importlib.util
+import statistics
 from dotenv import load_dotenv
-from minio import Minio
-from minio.error import S3Error
 from datetime import datetime
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Playwright, BeautifulSoup and minio are imported where they are used so
+# that light commands (--plan, --help) start instantly
+
+try:
+    import zstandard  # optional - only needed for zstd compressed uploads
+except ImportError:
+    zstandard = None
+
+try:
+    import psutil  # optional - accurate RSS for the whole browser process tree
+except ImportError:
+    psutil = None
+
+try:
+    import fcntl  # optional - POSIX only, serializes CIK set saves across processes
+except ImportError:
+    fcntl = None
+
+try:
+    from rapidfuzz import process as fuzz_process, fuzz, utils as fuzz_utils  # optional - faster batch scoring
+except ImportError:
+    fuzz_process = None
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 # Company data CSV files directory
@@ -27,6 +69,27 @@ os.makedirs(COMPANY_DATA_DIR, exist_ok=True)
 # Tracking CSV files in ROOT directory
 PROCESSED_CSV = os.path.join(os.getcwd(), 'processed_companies.csv')
 UNPROCESSED_CSV = os.path.join(os.getcwd(), 'unprocessed-companies.csv')
+FAILED_CSV = os.path.join(os.getcwd(), 'failed-companies.csv')
+MEMORY_LOG_CSV = os.path.join(os.getcwd(), 'memory_samples.csv')
+SHARD_MANIFEST_CSV = os.path.join(os.getcwd(), 'shard_manifest.csv')
+
+# Per-company page checkpoints (deleted once a company is saved)
+CHECKPOINT_DIR = os.path.join(os.getcwd(), 'checkpoints')
+
+# Cross-search company store (used when OUTPUT_CONFIG['entity_store'] is on)
+ENTITY_STORE_DB = os.path.join(os.getcwd(), 'entities.sqlite')
+
+# Saved login sessions (Playwright storage_state), one file per account
+SESSION_DIR = os.path.join(os.getcwd(), 'sessions')
+
+# Persistent Chromium profiles, one per worker (BROWSER_CONFIG['persistent_profile'])
+PROFILE_DIR = os.path.join(os.getcwd(), 'browser_profiles')
+
+# CIKs already scraped, with a crc32 of their title (--delta runs)
+CIK_SET_FILE = os.path.join(os.getcwd(), 'scraped_ciks.bin')
+
+# Per-process status files and logs for multi-process runs (--processes)
+SHARD_STATUS_DIR = os.path.join(os.getcwd(), 'shard_status')
 
 load_dotenv()
 
@@ -35,17 +98,876 @@ CREDENTIALS = {
     'password': os.getenv('CORPORATIONWIKI_PASSWORD')
 }
 
+# Optional account pool - path to a JSON list of {"email": ..., "password": ...}
+# (without it CREDENTIALS is the only account)
+ACCOUNTS_FILE = os.getenv('CORPORATIONWIKI_ACCOUNTS')
+
 # MinIO Configuration
+# (MINIO_* env vars override the defaults, e.g. to point at a local S3 stand-in)
 MINIO_CONFIG = {
-    'endpoint': 's3.us-east-005.oriobjects.cloud',
-    'access_key': '005775aede18e2e0000000023',
-    'secret_key': 'K005GD3X7YxPdbUEtP9mfYwatqf/ugg',
-    'bucket_name': 'holacracydata',
-    'folder_path': 'corporation_wiki_new',
-    'region': 'us-east-1',
-    'secure': True
+    'endpoint': os.getenv('MINIO_ENDPOINT', 's3.us-east-005.oriobjects.cloud'),
+    'access_key': os.getenv('MINIO_ACCESS_KEY', '005775aede18e2e0000000023'),
+    'secret_key': os.getenv('MINIO_SECRET_KEY', 'K005GD3X7YxPdbUEtP9mfYwatqf/ugg'),
+    'bucket_name': os.getenv('MINIO_BUCKET', 'holacracydata'),
+    'folder_path': os.getenv('MINIO_FOLDER', 'corporation_wiki_new'),
+    'region': os.getenv('MINIO_REGION', 'us-east-1'),
+    'secure': os.getenv('MINIO_SECURE', 'true').lower() != 'false'
+}
+
+# Run Configuration
+# - concurrency: number of companies scraped at the same time (one browser each)
+# - max_requests_per_second: cap on result-page navigations across all workers
+#   and prefetch tabs (None = no cap)
+# - schedule: 'input' keeps the input file order, 'lpt' starts the companies
+#   predicted to take the most pages first (see CostModel) - only worth it
+#   with concurrency > 1, so the parallel profiles turn it on
+# - account_strategy: how companies are spread over the account pool -
+#   'least_loaded' (fewest companies in flight, sticky per worker) or 'round_robin'
+# - company_budget_s / run_budget_s: time limits (None = unlimited). A company
+#   that runs out is saved as-is, logged with truncated=1 and resumed from its
+#   checkpoint in a remainder pass (or the next run); after the run budget no
+#   new companies are started
+# - remainder_passes: passes over truncated companies at the end of the run
+RUN_CONFIG = {
+    'concurrency': 1,
+    'max_requests_per_second': None,
+    'schedule': 'input',
+    'account_strategy': 'least_loaded',
+    'company_budget_s': None,
+    'run_budget_s': None,
+    'remainder_passes': 1,
+}
+
+# Browser Configuration
+# - engine: 'chromium', 'firefox' or 'webkit'
+# - *_timeout_ms: navigation / results / next-page wait timeouts
+# - warm_start: launch the browsers and restore sessions while MinIO connects
+#   and the input loads, instead of on the first company
+# - persistent_profile: run each worker's Chromium on a profile in PROFILE_DIR
+#   so its HTTP disk cache (disk_cache_mb) keeps the site's CSS/JS across
+#   companies, recycles and runs. Request interception disables that cache,
+#   so images are turned off with a blink setting instead (fonts load, cached)
+BROWSER_CONFIG = {
+    'engine': 'chromium',
+    'headless': True,
+    'nav_timeout_ms': 20000,
+    'results_timeout_ms': 5000,
+    'next_page_timeout_ms': 10000,
+    'warm_start': True,
+    'persistent_profile': False,
+    'disk_cache_mb': 256,
+}
+
+# Output Configuration
+# - upload: send results to MinIO (off = local CSV files only)
+# - write_local: keep a plain CSV copy in COMPANY_DATA_DIR
+# - compression: None, 'gzip' or 'zstd'. When set (or when write_local is off)
+#   results are serialized into an in-memory stream and sent with put_object
+# - skip_existing_remote: list the bucket folder once at startup and skip
+#   companies whose output object (or shard member) already exists (off by
+#   default - a rerun refreshes existing outputs; bulk-cluster turns it on)
+# - shard_mode: pack many companies into tar shards instead of one object each;
+#   a shard is uploaded once it holds shard_max_companies or shard_max_bytes
+# - entity_store: upsert every result card once into ENTITY_STORE_DB (keyed by
+#   company_url) and write per-company files as references only
+#   (REF_FIELDNAMES); the database is uploaded at the end of the run
+# - layout: 'flat' (one row per officer, company columns repeated) or
+#   'normalized' (a companies table plus a <name>.officers table, joined on
+#   result_id - see COMPANY_FIELDNAMES / OFFICER_FIELDNAMES)
+# - format: 'csv' or 'parquet' (columnar, needs pyarrow; compression is
+#   applied inside the file and empty cells become nulls)
+OUTPUT_CONFIG = {
+    'upload': True,
+    'write_local': True,
+    'compression': None,
+    'compression_level': None,
+    'shard_mode': False,
+    'shard_max_companies': 500,
+    'shard_max_bytes': 64 * 1024 * 1024,
+    'shard_folder': 'shards',
+    'skip_existing_remote': False,
+    'entity_store': False,
+    'layout': 'flat',
+    'format': 'csv',
+}
+
+COMPRESSION_SUFFIXES = {
+    None: '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+# Relevance Configuration
+# - enabled: score every page's company names against the search query
+# - threshold: stop paginating once a page's best score (0-100) falls below this
+# - min_pages: always scrape at least this many pages
+RELEVANCE_CONFIG = {
+    'enabled': False,
+    'threshold': 60.0,
+    'min_pages': 1,
+}
+
+# Query Planning Configuration
+# - normalize: strip jurisdiction tags ("/DE/") and legal suffixes ("INC.", "CO LTD")
+#   from SEC titles before searching
+# - fallback: if the first query finds nothing, retry with progressively
+#   less normalized forms of the title
+QUERY_CONFIG = {
+    'normalize': True,
+    'fallback': True,
+}
+
+# Trailing words dropped from SEC titles (repeatedly, so "HOLDINGS CORP" goes too)
+LEGAL_SUFFIXES = {
+    'INC', 'INCORPORATED', 'CORP', 'CORPORATION', 'CO', 'COMPANY', 'LTD', 'LIMITED',
+    'LLC', 'LLP', 'LP', 'PLC', 'SA', 'NV', 'AG', 'SE', 'HOLDINGS', 'HOLDING', 'THE',
+}
+
+# SEC state/country tags such as " /DE/", " /PR/", " \NV\" or a trailing " /DE" -
+# also written straight after the name ("CORP/DE/", "COMPANY/MN"), where only
+# 2-3 letter codes count so names like "NOVO NORDISK A/S" stay intact
+JURISDICTION_TAG_RE = re.compile(r'(?:\s[/\\][A-Z0-9 .&-]{1,12}?|(?<=\w)[/\\][A-Z]{2,3})(?:[/\\]|$)',
+                                 re.IGNORECASE)
+
+# Words that match thousands of companies - titles made of them page on and on
+GENERIC_WORDS = {
+    'AMERICAN', 'AMERICA', 'NATIONAL', 'INTERNATIONAL', 'GLOBAL', 'FIRST', 'UNITED',
+    'GROUP', 'CAPITAL', 'FINANCIAL', 'BANK', 'BANCORP', 'TRUST', 'FUND', 'INVESTMENT',
+    'INVESTMENTS', 'PARTNERS', 'ENERGY', 'RESOURCES', 'SERVICES', 'SYSTEMS', 'TECHNOLOGIES',
+    'TECHNOLOGY', 'INDUSTRIES', 'PROPERTIES', 'REALTY', 'HEALTH', 'MEDICAL', 'PHARMACEUTICALS',
+    'ENTERPRISES', 'SOLUTIONS', 'MANAGEMENT', 'DEVELOPMENT', 'INSURANCE', 'SECURITIES',
+}
+
+# Pagination Configuration
+# - page_param: query-string parameter used to open a results page directly
+#   when resuming from a checkpoint (falls back to clicking "next" if the
+#   pager does not land on the requested page)
+# - max_pages: stop a company's search after this many pages (None = no limit)
+# - page_delay: pause between result pages, in seconds
+# - prefetch_depth: load up to this many following pages on extra tabs (by
+#   page_param URL) while the current one is parsed (0 = click "next" instead)
+PAGINATION_CONFIG = {
+    'page_param': 'page',
+    'max_pages': None,
+    'page_delay': 0.5,
+    'prefetch_depth': 0,
 }
 
+# Retry Configuration
+# - max_attempts / base_delay / max_delay: jittered exponential backoff for
+#   transient failures (timeouts, network errors, 429/5xx)
+# - breaker_threshold / breaker_cooldown: after this many transient failures
+#   in a row all navigation pauses for the cooldown (the site is degraded)
+# - retry_lane_passes: extra passes over failed companies after the main pass
+RETRY_CONFIG = {
+    'max_attempts': 3,
+    'base_delay': 2.0,
+    'max_delay': 30.0,
+    'breaker_threshold': 5,
+    'breaker_cooldown': 120.0,
+    'retry_lane_passes': 1,
+}
+
+# Browser Recycling Configuration
+# - reuse_browser: keep one browser across companies instead of one per company
+# - max_pages_per_context / max_companies_per_context: start a fresh context
+# - max_companies_per_browser / max_rss_mb: relaunch the whole browser
+#   (max_rss_mb is per worker browser - Chromium and its renderers)
+# - memory_sample_every: log an RSS sample every N companies
+# Recycling only happens between companies, never during one.
+RECYCLE_CONFIG = {
+    'reuse_browser': True,
+    'max_pages_per_context': 500,
+    'max_companies_per_context': 50,
+    'max_companies_per_browser': 200,
+    'max_rss_mb': 2048,
+    'memory_sample_every': 10,
+}
+
+# Parsing Configuration
+# - workers: 0 parses on the event loop thread, N > 0 uses a process pool
+#   so HTML parsing runs on other cores while navigation continues
+# - parser: BeautifulSoup parser ('html.parser' or 'lxml')
+# - mode: 'html' ships page.content() to Python and parses it there,
+#   'evaluate' runs EXTRACT_RESULTS_JS in the page and returns compact JSON
+# - benchmark: run both modes on every page and report bytes/time for each
+PARSE_CONFIG = {
+    'workers': 0,
+    'parser': 'html.parser',
+    'mode': 'html',
+    'benchmark': False,
+}
+
+# Pipeline Configuration
+# - enabled: hand finished companies to background write/upload stages so the
+#   browsers go straight on to the next company (off = save inline)
+# - write_workers / upload_workers: concurrent workers per stage
+# - queue_size: companies allowed to wait in front of each stage; when a queue
+#   is full the stage before it blocks, down to the browser workers
+PIPELINE_CONFIG = {
+    'enabled': True,
+    'write_workers': 1,
+    'upload_workers': 2,
+    'queue_size': 4,
+}
+
+# Logging Configuration
+# - level: log level ('DEBUG' shows every per-page event)
+# - format: 'text' (LOG_FORMAT lines) or 'json' (one object per line with the
+#   event's fields - company, page, results, ...)
+# - page_sample: also log every Nth page at INFO (0 = per-page events at DEBUG only);
+#   per-company summaries are always INFO
+# - queue: hand records to a QueueListener thread so workers never block on
+#   the log stream
+LOG_CONFIG = {
+    'level': 'INFO',
+    'format': 'text',
+    'page_sample': 0,
+    'queue': True,
+}
+
+# Named run profiles - each one overrides the config sections above
+RUN_PROFILES = {
+    'default': {},
+    'fast': {
+        'run': {'concurrency': 4, 'schedule': 'lpt'},
+        'browser': {'nav_timeout_ms': 15000, 'next_page_timeout_ms': 8000},
+        'pagination': {'page_delay': 0.2, 'prefetch_depth': 2},
+        'parse': {'workers': 2, 'parser': 'lxml'},
+        'relevance': {'enabled': True},
+    },
+    'polite': {
+        'run': {'concurrency': 1},
+        'browser': {'nav_timeout_ms': 30000, 'next_page_timeout_ms': 20000},
+        'pagination': {'page_delay': 2.0},
+        'retry': {'base_delay': 5.0, 'max_delay': 120.0},
+    },
+    'bulk-cluster': {
+        'run': {'concurrency': 8, 'schedule': 'lpt'},
+        'parse': {'workers': 4, 'parser': 'lxml'},
+        'pagination': {'max_pages': 100, 'page_delay': 0.2},
+        'relevance': {'enabled': True},
+        'output': {'write_local': False, 'compression': 'gzip', 'shard_mode': True,
+                   'skip_existing_remote': True},
+        'logging': {'format': 'json'},
+    },
+}
+
+BASE_URL = 'https://www.corporationwiki.com'
+
+CSV_FIELDNAMES = ['page', 'result_on_page', 'company_name', 'location',
+                  'company_url', 'officer_name', 'officer_url', 'officer_id', 'total_officers',
+                  'match_score']
+
+PROCESSED_FIELDNAMES = ['company_name', 'total_companies_found', 'total_pages', 'total_officers',
+                        'timestamp', 'csv_filename', 'truncated']
+
+# Shard manifests (the per-shard copy in MinIO has no timestamp). truncated=1
+# marks a partial save - the latest truncated=0 copy of a company wins
+MANIFEST_FIELDNAMES = ['company_name', 'member', 'shard', 'offset', 'size', 'timestamp', 'truncated']
+
+# Normalized layout - one row per result card, one per officer, joined on result_id
+COMPANY_FIELDNAMES = ['result_id', 'page', 'result_on_page', 'company_name', 'location',
+                      'company_url', 'total_officers', 'match_score']
+OFFICER_FIELDNAMES = ['result_id', 'officer_name', 'officer_url', 'officer_id']
+
+# Per-company columns in entity_store mode - details live in ENTITY_STORE_DB
+REF_FIELDNAMES = ['page', 'result_on_page', 'company_url', 'match_score']
+
+
+def open_compressed_writer(buffer, compression, level=None):
+    """Wrap a binary buffer with a gzip/zstd compressor (or return it as-is)"""
+    if not compression:
+        return buffer
+    
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=level or 6, mtime=0)
+    
+    if compression == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd compression requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=level or 3).stream_writer(buffer, closefd=False)
+    
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+# Config sections that profiles, --config files and --set can override
+CONFIG_SECTIONS = {
+    'run': RUN_CONFIG,
+    'browser': BROWSER_CONFIG,
+    'output': OUTPUT_CONFIG,
+    'relevance': RELEVANCE_CONFIG,
+    'query': QUERY_CONFIG,
+    'pagination': PAGINATION_CONFIG,
+    'retry': RETRY_CONFIG,
+    'recycle': RECYCLE_CONFIG,
+    'parse': PARSE_CONFIG,
+    'pipeline': PIPELINE_CONFIG,
+    'logging': LOG_CONFIG,
+    'minio': MINIO_CONFIG,
+}
+
+
+def apply_config_overrides(overrides):
+    """Apply {section: {key: value}} overrides to the module config dicts"""
+    for section, values in overrides.items():
+        if section not in CONFIG_SECTIONS:
+            raise ValueError(f"Unknown config section: {section}")
+        
+        config = CONFIG_SECTIONS[section]
+        for key, value in values.items():
+            if key not in config:
+                raise ValueError(f"Unknown config key: {section}.{key}")
+            config[key] = value
+
+
+# Attributes every LogRecord has - anything else came in through extra=
+LOG_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the fields passed through extra="""
+    
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'msg': record.getMessage(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in LOG_RECORD_ATTRS)
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging(config=LOG_CONFIG):
+    """Configure the root logger from LOG_CONFIG (replaces the import-time basicConfig)"""
+    handler = logging.StreamHandler()
+    if config.get('format') == 'json':
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    root = logging.getLogger()
+    for old in root.handlers[:]:
+        root.removeHandler(old)
+    root.setLevel(config.get('level', 'INFO'))
+    
+    if not config.get('queue'):
+        root.addHandler(handler)
+        return None
+    
+    # Workers only enqueue - formatting and the stream write happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def init_parse_worker():
+    """Process pool initializer - the parent's log queue does not reach the workers"""
+    # Ctrl+C is handled by the parent's graceful shutdown - workers finish their page
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    setup_logging(dict(LOG_CONFIG, queue=False))
+
+
+def log_page_event(page_number, message, *args, **fields):
+    """Per-page progress - DEBUG, except every LOG_CONFIG['page_sample']th page at INFO"""
+    sample = LOG_CONFIG.get('page_sample')
+    level = logging.INFO if sample and page_number and page_number % sample == 0 else logging.DEBUG
+    if logger.isEnabledFor(level):
+        logger.log(level, message, *args, extra={'event': 'page', 'page': page_number, **fields})
+
+
+class FailureKind:
+    """Failure classification for navigation and scraping errors"""
+    TIMEOUT = 'timeout'
+    AUTH_WALL = 'auth_wall'
+    HTTP_ERROR = 'http_error'
+    PARSE_EMPTY = 'parse_empty'
+    OTHER = 'other'
+    
+    ALL = (TIMEOUT, AUTH_WALL, HTTP_ERROR, PARSE_EMPTY, OTHER)
+    # Worth retrying the same query later rather than moving on to a broader one
+    TRANSIENT = (TIMEOUT, HTTP_ERROR)
+
+
+class Outcome:
+    """Per-company result of scrape_company_fast (failures return a FailureKind)"""
+    PROCESSED = 'processed'
+    TRUNCATED = 'truncated'
+    NO_RESULTS = 'no_results'
+    INTERRUPTED = 'interrupted'
+
+
+class ScrapeError(Exception):
+    """Error with an explicit failure kind (and HTTP status when known)"""
+    
+    def __init__(self, kind, message, status=None):
+        super().__init__(message)
+        self.kind = kind
+        self.status = status
+
+
+def classify_error(exc):
+    """Map an exception to a FailureKind"""
+    if isinstance(exc, ScrapeError):
+        return exc.kind
+    
+    # Playwright raises its own TimeoutError class
+    if isinstance(exc, asyncio.TimeoutError) or type(exc).__name__ == 'TimeoutError':
+        return FailureKind.TIMEOUT
+    
+    message = str(exc)
+    if 'net::ERR_' in message or 'NS_ERROR_' in message:
+        return FailureKind.HTTP_ERROR
+    
+    return FailureKind.OTHER
+
+
+def is_transient(exc):
+    """Transient failures are worth retrying with backoff"""
+    kind = classify_error(exc)
+    
+    if kind == FailureKind.TIMEOUT:
+        return True
+    
+    if kind == FailureKind.HTTP_ERROR:
+        status = getattr(exc, 'status', None)
+        # Network errors (no status), rate limiting and server errors
+        return status is None or status == 429 or status >= 500
+    
+    return False
+
+
+class RetryPolicy:
+    """Jittered exponential backoff"""
+    
+    def __init__(self, max_attempts=3, base_delay=2.0, max_delay=30.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+    
+    def delay(self, attempt):
+        """Delay before retry number `attempt` (1-based) - half fixed, half random"""
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return cap / 2 + random.uniform(0, cap / 2)
+
+
+class CircuitBreaker:
+    """Pause all navigation when the site keeps failing"""
+    
+    def __init__(self, threshold=5, cooldown=120.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+    
+    def record_success(self):
+        if self.opened_at is not None or self.failures >= self.threshold:
+            logger.info("✅ Circuit breaker closed - site responding again")
+        self.failures = 0
+        self.opened_at = None
+    
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold and self.opened_at is None:
+            self.opened_at = time.monotonic()
+            logger.warning(f"🚧 Circuit breaker OPEN after {self.failures} failures - "
+                           f"pausing {self.cooldown:.0f}s")
+    
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+    
+    async def wait_if_open(self):
+        """Block until the cooldown has passed, then let one probe through (half-open)"""
+        if self.opened_at is None:
+            return
+        
+        remaining = self.opened_at + self.cooldown - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        
+        # Half-open: the next failure re-opens immediately
+        self.opened_at = None
+        self.failures = self.threshold - 1
+
+
+class RateLimiter:
+    """Space out navigations - shared by every worker and prefetch tab"""
+    
+    def __init__(self, max_per_second=None):
+        self.interval = 1.0 / max_per_second if max_per_second else 0.0
+        self.next_slot = 0.0
+        self.waits = 0
+    
+    async def acquire(self):
+        """Wait for the next free slot (no-op without a cap)"""
+        if not self.interval:
+            return
+        
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        
+        if slot > now:
+            self.waits += 1
+            await asyncio.sleep(slot - now)
+
+
+def process_tree_rss_mb(root_pids=None):
+    """Resident memory of a process tree in MB - by default this process plus its children"""
+    roots = set(root_pids) if root_pids else {os.getpid()}
+    
+    if psutil is not None:
+        tree = {}
+        for pid in roots:
+            try:
+                proc = psutil.Process(pid)
+                tree[pid] = proc
+                tree.update((child.pid, child) for child in proc.children(recursive=True))
+            except psutil.Error:
+                continue
+        total = 0
+        for proc in tree.values():
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    
+    # Linux fallback - walk /proc for descendants of this process
+    try:
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        parents = {}
+        rss_pages = {}
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f'/proc/{pid}/stat', 'r') as f:
+                    fields = f.read().rsplit(')', 1)[1].split()
+            except OSError:
+                continue
+            parents[int(pid)] = int(fields[1])
+            rss_pages[int(pid)] = int(fields[21])
+        
+        tree = set(roots)
+        changed = True
+        while changed:
+            changed = False
+            for pid, ppid in parents.items():
+                if ppid in tree and pid not in tree:
+                    tree.add(pid)
+                    changed = True
+        
+        return sum(rss_pages.get(pid, 0) for pid in tree) * page_size / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+def pids_with_arg(arg):
+    """Pids whose command line contains arg (e.g. one browser's launch marker)"""
+    if psutil is not None:
+        pids = []
+        for proc in psutil.process_iter(['cmdline']):
+            if arg in (proc.info['cmdline'] or ()):
+                pids.append(proc.pid)
+        return pids
+    
+    pids = []
+    try:
+        names = os.listdir('/proc')
+    except OSError:
+        return pids
+    for pid in names:
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                cmdline = f.read().split(b'\0')
+        except OSError:
+            continue
+        if arg.encode() in cmdline:
+            pids.append(int(pid))
+    return pids
+
+
+def company_csv_filename(company_name):
+    """Build the per-company CSV filename used locally and in MinIO"""
+    clean_name = re.sub(r'[^\w\s-]', '', company_name).strip()
+    clean_name = re.sub(r'[-\s]+', '_', clean_name)
+    return f"{clean_name}.csv"
+
+
+def shard_of(company_name, shard_count):
+    """Deterministic process shard for a company (same title, same shard, every run)"""
+    return zlib.crc32(company_name.encode('utf-8')) % shard_count
+
+
+def write_shard_status(shard_index, status):
+    """Atomically replace this process's status file for the launcher's progress view"""
+    path = os.path.join(SHARD_STATUS_DIR, f"shard-{shard_index}.json")
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(status, f)
+    os.replace(tmp_path, path)
+
+
+def read_shard_status(shard_index):
+    try:
+        with open(os.path.join(SHARD_STATUS_DIR, f"shard-{shard_index}.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def score_names(query, names):
+    """Score a batch of company names against the query (0-100)"""
+    if not names:
+        return []
+    
+    if fuzz_process is not None:
+        scores = [0.0] * len(names)
+        for _, score, idx in fuzz_process.extract(query, names, scorer=fuzz.token_set_ratio,
+                                                  processor=fuzz_utils.default_process, limit=None):
+            scores[idx] = score
+        return scores
+    
+    # Fallback without rapidfuzz - slower, but the same token-set score so thresholds mean the same
+    query_tokens = set(re.findall(r'[^\W_]+', query.lower()))
+    return [token_set_ratio(query_tokens, set(re.findall(r'[^\W_]+', name.lower()))) for name in names]
+
+
+def token_set_ratio(tokens_a, tokens_b):
+    """difflib version of rapidfuzz's token_set_ratio for two token sets (0-100)"""
+    if not tokens_a or not tokens_b:
+        return 0.0
+    
+    common = tokens_a & tokens_b
+    if common and (tokens_a <= tokens_b or tokens_b <= tokens_a):
+        # One name is the other plus extra words
+        return 100.0
+    
+    sect = ' '.join(sorted(common))
+    combined_a = ' '.join(filter(None, [sect, ' '.join(sorted(tokens_a - tokens_b))]))
+    combined_b = ' '.join(filter(None, [sect, ' '.join(sorted(tokens_b - tokens_a))]))
+    
+    best = difflib.SequenceMatcher(None, combined_a, combined_b, autojunk=False).ratio()
+    if sect:
+        # sect is a prefix of both combined strings - their similarity follows from the lengths
+        best = max(best, 2 * len(sect) / (len(sect) + len(combined_a)),
+                   2 * len(sect) / (len(sect) + len(combined_b)))
+    return best * 100
+
+
+def normalize_title(title, strip_suffixes=True):
+    """Normalize an SEC title - drop jurisdiction tags, punctuation and (optionally) legal suffixes"""
+    name = JURISDICTION_TAG_RE.sub(' ', title)
+    name = re.sub(r"[^\w&' ]+", ' ', name)
+    words = name.upper().split()
+    
+    if strip_suffixes:
+        # Strip suffix words from the end, but never the whole name
+        while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+            words.pop()
+    
+    return ' '.join(words)
+
+
+def plan_queries(title):
+    """Plan the search queries for a title - first choice first, fallbacks after"""
+    title = title.strip()
+    
+    if not QUERY_CONFIG.get('normalize'):
+        return [title]
+    
+    candidates = [
+        normalize_title(title),
+        normalize_title(title, strip_suffixes=False),
+        title,
+    ]
+    
+    queries = []
+    for query in candidates:
+        if query and query.upper() not in (q.upper() for q in queries):
+            queries.append(query)
+    
+    if not QUERY_CONFIG.get('fallback'):
+        return queries[:1]
+    
+    return queries
+
+
+def expand_url(href):
+    """Expand a relative site path into an absolute URL (at serialization time)"""
+    if href is None:
+        return ''
+    if href.startswith('/'):
+        return BASE_URL + href
+    return urljoin(BASE_URL, href)
+
+
+class OfficerRecord:
+    """Compact officer record - stores the relative href only"""
+    
+    __slots__ = ('name', 'href', 'entity_id')
+    
+    def __init__(self, name, href, entity_id):
+        self.name = name
+        self.href = href
+        self.entity_id = entity_id
+    
+    @property
+    def url(self):
+        return expand_url(self.href)
+    
+    def to_list(self):
+        return [self.name, self.href, self.entity_id]
+
+
+class ResultRecord:
+    """Compact search result record - one per result card"""
+    
+    __slots__ = ('page', 'result_on_page', 'company_name', 'location', 'company_href', 'officers',
+                 'match_score')
+    
+    def __init__(self, company_name='', company_href=None, location='', officers=None,
+                 page=0, result_on_page=0, match_score=None):
+        self.page = page
+        self.result_on_page = result_on_page
+        self.company_name = company_name
+        self.location = location
+        self.company_href = company_href
+        self.officers = officers if officers is not None else []
+        self.match_score = match_score
+    
+    @property
+    def company_url(self):
+        return expand_url(self.company_href)
+    
+    @property
+    def total_officers(self):
+        return len(self.officers)
+    
+    @property
+    def entity_key(self):
+        """Entity store key - the company URL (name + location for cards without a link)"""
+        return self.company_url or f"name:{self.company_name}|{self.location}"
+    
+    def to_list(self):
+        """Compact JSON-friendly form (used by checkpoints)"""
+        return [self.page, self.result_on_page, self.company_name, self.location,
+                self.company_href, self.match_score, [o.to_list() for o in self.officers]]
+    
+    @classmethod
+    def from_list(cls, data):
+        page, result_on_page, company_name, location, company_href, match_score, officers = data
+        return cls(company_name, company_href, location, [OfficerRecord(*o) for o in officers],
+                   page, result_on_page, match_score)
+    
+    def iter_rows(self):
+        """Yield CSV rows (CSV_FIELDNAMES order) - one per officer, or one if none"""
+        company_url = self.company_url
+        total_officers = len(self.officers)
+        match_score = '' if self.match_score is None else round(self.match_score, 1)
+        
+        if not self.officers:
+            yield (self.page, self.result_on_page, self.company_name, self.location,
+                   company_url, '', '', '', total_officers, match_score)
+            return
+        
+        for officer in self.officers:
+            yield (self.page, self.result_on_page, self.company_name, self.location,
+                   company_url, officer.name, officer.url, officer.entity_id, total_officers,
+                   match_score)
+    
+    def company_row(self, result_id):
+        """Companies table row (COMPANY_FIELDNAMES order) for the normalized layout"""
+        match_score = '' if self.match_score is None else round(self.match_score, 1)
+        return (result_id, self.page, self.result_on_page, self.company_name, self.location,
+                self.company_url, len(self.officers), match_score)
+    
+    def officer_rows(self, result_id):
+        """Officers table rows (OFFICER_FIELDNAMES order) for the normalized layout"""
+        return [(result_id, officer.name, officer.url, officer.entity_id) for officer in self.officers]
+    
+    def ref_row(self):
+        """Reference row (REF_FIELDNAMES order) for entity_store mode"""
+        match_score = '' if self.match_score is None else round(self.match_score, 1)
+        return (self.page, self.result_on_page, self.entity_key, match_score)
+
+
+class CheckpointStore:
+    """Per-company JSON-lines checkpoints - one line per scraped page"""
+    
+    def __init__(self, checkpoint_dir=CHECKPOINT_DIR):
+        self.checkpoint_dir = checkpoint_dir
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+    
+    def _path(self, company_name):
+        return os.path.join(self.checkpoint_dir, company_csv_filename(company_name)[:-4] + '.jsonl')
+    
+    def _append(self, company_name, entry, mode='a'):
+        with open(self._path(company_name), mode, encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def start(self, company_name, query):
+        """Start a fresh checkpoint for a company's search"""
+        self._append(company_name, {'query': query}, mode='w')
+    
+    def write_page(self, company_name, page, results):
+        """Checkpoint one page's parsed results and the pager position"""
+        self._append(company_name, {'page': page, 'results': [r.to_list() for r in results]})
+    
+    def mark_done(self, company_name):
+        """Mark pagination as finished (results may still need saving)"""
+        self._append(company_name, {'done': True})
+    
+    def load(self, company_name):
+        """Load a checkpoint - returns None if there is nothing to resume"""
+        path = self._path(company_name)
+        if not os.path.exists(path):
+            return None
+        
+        state = {'query': None, 'last_page': 0, 'done': False, 'results': []}
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn last line from a crash mid-write
+                    break
+                
+                if 'query' in entry:
+                    state['query'] = entry['query']
+                elif 'page' in entry:
+                    state['last_page'] = entry['page']
+                    state['results'].extend(ResultRecord.from_list(r) for r in entry['results'])
+                elif entry.get('done'):
+                    state['done'] = True
+        
+        if not state['query'] or not state['last_page']:
+            return None
+        
+        return state
+    
+    def exists(self, company_name):
+        return os.path.exists(self._path(company_name))
+    
+    def clear(self, company_name):
+        """Remove a company's checkpoint once its results are saved"""
+        try:
+            os.remove(self._path(company_name))
+        except FileNotFoundError:
+            pass
+
 
 class TrackingCSV:
     """Handle processed and unprocessed company tracking"""
@@ -62,14 +984,9 @@ class TrackingCSV:
         if not os.path.exists(self.processed_csv):
             with open(self.processed_csv, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    'company_name', 
-                    'total_companies_found', 
-                    'total_pages',
-                    'total_officers',
-                    'timestamp',
-                    'csv_filename'
-                ])
+                writer.writerow(PROCESSED_FIELDNAMES)
+        else:
+            self._upgrade_processed_header()
         
         # Unprocessed companies CSV - ONLY COMPANIES WITH NO RESULTS
         if not os.path.exists(self.unprocessed_csv):
@@ -81,9 +998,28 @@ class TrackingCSV:
                     'search_term'
                 ])
     
+    def _upgrade_processed_header(self):
+        """Add columns introduced since the file was created (old rows get blanks)"""
+        with open(self.processed_csv, 'r', newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        
+        if not rows or rows[0] == PROCESSED_FIELDNAMES:
+            return
+        
+        missing = len(PROCESSED_FIELDNAMES) - len(rows[0])
+        tmp_path = self.processed_csv + '.tmp'
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(PROCESSED_FIELDNAMES)
+            writer.writerows(row + [''] * missing for row in rows[1:])
+        os.replace(tmp_path, self.processed_csv)
+    
     def log_processed(self, company_name, total_companies=0, total_pages=0, 
-                     total_officers=0, csv_filename=''):
-        """Log a successfully processed company (ONLY companies WITH results)"""
+                     total_officers=0, csv_filename='', truncated=False):
+        """Log a successfully processed company (ONLY companies WITH results)
+        
+        truncated=True marks a partial save - the company is finished later.
+        """
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         with open(self.processed_csv, 'a', newline='', encoding='utf-8') as f:
@@ -94,7 +1030,8 @@ class TrackingCSV:
                 total_pages,
                 total_officers,
                 timestamp,
-                csv_filename
+                csv_filename,
+                int(truncated)
             ])
         
         logger.info(f"📊 Added to processed_companies.csv: {company_name}")
@@ -112,6 +1049,19 @@ class TrackingCSV:
             ])
         
         logger.info(f"📊 Added to unprocessed-companies.csv: {company_name}")
+    
+    def log_failed(self, company_name, failure_kind):
+        """Log a company that still failed after the retry lane"""
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        new_file = not os.path.exists(FAILED_CSV)
+        with open(FAILED_CSV, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(['company_name', 'failure_kind', 'timestamp'])
+            writer.writerow([company_name, failure_kind, timestamp])
+        
+        logger.info(f"📊 Added to failed-companies.csv: {company_name} ({failure_kind})")
 
 
 class MinIOUploader:
@@ -122,8 +1072,10 @@ class MinIOUploader:
         self.client = None
         
     def connect(self):
-        """Connect to MinIO"""
+        """Connect to MinIO and check the bucket (a round trip, not just a client object)"""
         try:
+            from minio import Minio
+            
             self.client = Minio(
                 self.config['endpoint'],
                 access_key=self.config['access_key'],
@@ -131,6 +1083,9 @@ class MinIOUploader:
                 secure=self.config['secure'],
                 region=self.config.get('region', 'us-east-1')
             )
+            if not self.client.bucket_exists(self.config['bucket_name']):
+                logger.error(f"❌ MinIO bucket not found: {self.config['bucket_name']}")
+                return False
             logger.info("✅ MinIO connected")
             return True
         except Exception as e:
@@ -156,77 +1111,1497 @@ class MinIOUploader:
         except Exception as e:
             logger.error(f"❌ MinIO upload failed: {e}")
             return False
-
-
-class FastCorporationWikiScraper:
-    """Optimized scraper with minimal delays"""
     
-    def __init__(self, credentials, minio_uploader=None):
-        self.browser = None
-        self.context = None
-        self.page = None
-        self.playwright = None
-        self.credentials = credentials
-        self.minio_uploader = minio_uploader
-        self.all_results = []
-        self.current_page = 1
-        self.is_logged_in = False
-        self.auth_handled = False
+    def upload_bytes(self, data, remote_name, content_type='text/csv', content_encoding=None):
+        """Upload an in-memory payload to MinIO (no local file needed)"""
+        try:
+            folder_path = self.config.get('folder_path', '')
+            if folder_path:
+                remote_name = f"{folder_path}/{remote_name}"
+            
+            bucket_name = self.config['bucket_name']
+            
+            metadata = {'Content-Encoding': content_encoding} if content_encoding else None
+            
+            self.client.put_object(
+                bucket_name,
+                remote_name,
+                io.BytesIO(data),
+                length=len(data),
+                content_type=content_type,
+                metadata=metadata
+            )
+            logger.info(f"✅ Uploaded to MinIO: {bucket_name}/{remote_name} ({len(data)} bytes)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ MinIO upload failed: {e}")
+            return False
     
-    async def setup(self):
-        """Setup browser - optimized"""
-        logger.info("🚀 Starting browser...")
+    def list_objects(self):
+        """List every object name under folder_path (relative to the folder)"""
+        folder_path = self.config.get('folder_path', '')
+        prefix = f"{folder_path}/" if folder_path else ''
         
-        self.playwright = await async_playwright().start()
+        names = set()
+        for obj in self.client.list_objects(self.config['bucket_name'], prefix=prefix, recursive=True):
+            names.add(obj.object_name[len(prefix):])
         
-        self.browser = await self.playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--disable-software-rasterizer',
-            ]
-        )
+        return names
+    
+    def read_object(self, remote_name):
+        """Read a (small) object fully into memory"""
+        folder_path = self.config.get('folder_path', '')
+        if folder_path:
+            remote_name = f"{folder_path}/{remote_name}"
         
-        self.context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        response = self.client.get_object(self.config['bucket_name'], remote_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+
+class RemoteInventory:
+    """In-memory set of company outputs that already exist in MinIO"""
+    
+    def __init__(self):
+        self.filenames = set()
+    
+    def load(self, minio_uploader):
+        """List the bucket folder once, including members of uploaded shards"""
+        try:
+            object_names = minio_uploader.list_objects()
+        except Exception as e:
+            logger.error(f"❌ Remote inventory failed: {e}")
+            return False
+        
+        for name in object_names:
+            if name.endswith('.manifest.csv'):
+                try:
+                    manifest = minio_uploader.read_object(name).decode('utf-8')
+                except Exception as e:
+                    logger.warning(f"⚠️  Could not read shard manifest {name}: {e}")
+                    continue
+                
+                for row in csv.DictReader(io.StringIO(manifest)):
+                    # A truncated copy is superseded by a later complete one - it does not count
+                    if row.get('truncated') != '1':
+                        self.filenames.add(self._strip_suffix(row['member']))
+            else:
+                filename = self._strip_suffix(os.path.basename(name))
+                if filename.endswith('.csv'):
+                    self.filenames.add(filename)
+        
+        logger.info(f"☁️  Remote inventory: {len(self.filenames)} company outputs already uploaded")
+        return True
+    
+    def save(self, path):
+        """Write the listing to a file (the launcher lists once for all its processes)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{name}\n" for name in sorted(self.filenames))
+    
+    def load_file(self, path):
+        """Read a listing written by save() instead of listing the bucket again"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.filenames.update(line.rstrip('\n') for line in f if line.strip())
+        except OSError as e:
+            logger.error(f"❌ Could not read remote inventory {path}: {e}")
+            return False
+        
+        logger.info(f"☁️  Remote inventory: {len(self.filenames)} company outputs already uploaded")
+        return True
+    
+    @staticmethod
+    def _strip_suffix(name):
+        """Drop compression suffixes so .csv, .csv.gz, .csv.zst and .parquet all match"""
+        if name.endswith('.parquet'):
+            return name[:-len('.parquet')] + '.csv'
+        for suffix in COMPRESSION_SUFFIXES.values():
+            if suffix and name.endswith(suffix):
+                return name[:-len(suffix)]
+        return name
+    
+    def contains(self, company_name):
+        """Check if a company's output already exists remotely"""
+        return company_csv_filename(company_name) in self.filenames
+    
+    def add(self, company_name):
+        """Record a company uploaded during this run"""
+        self.filenames.add(company_csv_filename(company_name))
+
+
+class ShardWriter:
+    """Pack many small per-company payloads into size/count-bounded tar shards
+    
+    Companies only count as saved once their shard is uploaded: on_uploaded
+    is called for each of them then (tracking + checkpoint cleanup). A shard
+    that fails to upload is kept in memory and retried on the next flush.
+    Manifest rows carry a truncated flag: a company's copy with truncated=1
+    is a partial save, superseded by the latest copy with truncated=0.
+    """
+    
+    def __init__(self, minio_uploader, max_companies=500, max_bytes=64 * 1024 * 1024,
+                 folder='shards', manifest_csv=SHARD_MANIFEST_CSV, on_uploaded=None):
+        self.minio_uploader = minio_uploader
+        self.max_companies = max_companies
+        self.max_bytes = max_bytes
+        self.folder = folder
+        self.manifest_csv = manifest_csv
+        self.on_uploaded = on_uploaded
+        # The pid keeps shard names unique when several processes start together
+        self.run_id = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+        self.shard_index = 0
+        self.shards_uploaded = 0
+        self.failed_shards = []
+        self.unsaved = []
+        # Uploads run on worker threads - one company (and shard flush) at a time
+        self.lock = threading.Lock()
+        self._open_shard()
+        self._init_manifest()
+    
+    def _init_manifest(self):
+        """Initialize manifest CSV with headers if it doesn't exist (or add new columns)"""
+        if not os.path.exists(self.manifest_csv):
+            with open(self.manifest_csv, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(MANIFEST_FIELDNAMES)
+            return
+        
+        with open(self.manifest_csv, 'r', newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        
+        if not rows or rows[0] == MANIFEST_FIELDNAMES:
+            return
+        
+        # Old rows predate the truncated flag - blank means unknown
+        missing = len(MANIFEST_FIELDNAMES) - len(rows[0])
+        tmp_path = self.manifest_csv + '.tmp'
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(MANIFEST_FIELDNAMES)
+            writer.writerows(row + [''] * missing for row in rows[1:])
+        os.replace(tmp_path, self.manifest_csv)
+    
+    def _open_shard(self):
+        """Start a new in-memory tar shard"""
+        self.shard_index += 1
+        self.shard_name = f"{self.folder}/shard-{self.run_id}-{self.shard_index:05d}.tar"
+        self.buffer = io.BytesIO()
+        self.tar = tarfile.open(fileobj=self.buffer, mode='w', format=tarfile.PAX_FORMAT)
+        self.entries = []
+        self.outputs = []
+        # A company can have several members (normalized layout) - the limit counts companies
+        self.companies = set()
+    
+    def add(self, company_name, member_name, payload, truncated=False):
+        """Add one payload to the current shard, returns 'shard#member'"""
+        info = tarfile.TarInfo(name=member_name)
+        info.size = len(payload)
+        info.mtime = int(time.time())
+        
+        self.tar.addfile(info, io.BytesIO(payload))
+        
+        # tar.offset now points past the padded data block - step back to its start
+        padded_size = -(-info.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        offset = self.tar.offset - padded_size
+        
+        self.entries.append([company_name, member_name, self.shard_name, offset, info.size,
+                             '1' if truncated else '0'])
+        self.companies.add(company_name)
+        return f"{self.shard_name}#{member_name}"
+    
+    def finish_company(self, output):
+        """All of a company's members are in - flush the shard once it is full"""
+        self.outputs.append(output)
+        
+        if len(self.companies) >= self.max_companies or self.tar.offset >= self.max_bytes:
+            self.flush()
+    
+    def flush(self):
+        """Upload the current shard plus its manifest and start a new one"""
+        self.retry_failed()
+        
+        if not self.entries:
+            return True
+        
+        self.tar.close()
+        shard = {'name': self.shard_name, 'payload': self.buffer.getvalue(),
+                 'entries': self.entries, 'outputs': self.outputs}
+        self._open_shard()
+        
+        if self._upload(shard):
+            return True
+        
+        logger.error(f"❌ Shard upload failed: {shard['name']} ({len(shard['outputs'])} companies) - "
+                     f"kept for retry")
+        self.failed_shards.append(shard)
+        return False
+    
+    def retry_failed(self):
+        for shard in list(self.failed_shards):
+            if self._upload(shard):
+                self.failed_shards.remove(shard)
+    
+    def _upload(self, shard):
+        payload = shard['payload']
+        if not self.minio_uploader.upload_bytes(payload, shard['name'], content_type='application/x-tar'):
+            return False
+        
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        manifest = io.StringIO()
+        writer = csv.writer(manifest)
+        writer.writerow([name for name in MANIFEST_FIELDNAMES if name != 'timestamp'])
+        writer.writerows(shard['entries'])
+        
+        # The remote inventory finds shard members only through the manifest - no manifest, no save
+        if not self.minio_uploader.upload_bytes(
+            manifest.getvalue().encode('utf-8'),
+            f"{shard['name']}.manifest.csv",
+            content_type='text/csv'
+        ):
+            return False
+        
+        with open(self.manifest_csv, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for entry in shard['entries']:
+                writer.writerow(entry[:5] + [timestamp] + entry[5:])
+        
+        self.shards_uploaded += 1
+        logger.info(f"📦 Shard uploaded: {shard['name']} ({len(shard['outputs'])} companies, {len(payload)} bytes)")
+        
+        if self.on_uploaded:
+            for output in shard['outputs']:
+                self.on_uploaded(output)
+        return True
+    
+    def close(self):
+        """Flush any partially filled shard - companies in shards that never uploaded end up in unsaved"""
+        self.flush()
+        
+        self.unsaved = [output for shard in self.failed_shards for output in shard['outputs']]
+        if self.unsaved:
+            # Their checkpoints were never cleared - the next run redoes the save
+            logger.error(f"❌ {len(self.failed_shards)} shards could not be uploaded "
+                         f"({len(self.unsaved)} companies kept in {CHECKPOINT_DIR}/)")
+        return not self.failed_shards
+
+
+def result_tables(results, layout='flat', refs_only=False):
+    """Split results into the tables of one company's output
+    
+    Returns [(filename suffix, fieldnames, rows)] - the first table is the
+    company's main file, a normalized layout adds '.officers'. rows() makes
+    a fresh row generator, so each consumer streams instead of sharing a list.
+    """
+    if refs_only:
+        return [('', REF_FIELDNAMES, lambda: (result.ref_row() for result in results))]
+    
+    if layout == 'normalized':
+        return [
+            ('', COMPANY_FIELDNAMES,
+             lambda: (result.company_row(result_id) for result_id, result in enumerate(results))),
+            ('.officers', OFFICER_FIELDNAMES,
+             lambda: (row for result_id, result in enumerate(results)
+                      for row in result.officer_rows(result_id))),
+        ]
+    
+    if layout != 'flat':
+        raise ValueError(f"Unknown output layout: {layout}")
+    
+    return [('', CSV_FIELDNAMES, lambda: (row for result in results for row in result.iter_rows()))]
+
+
+def write_table_csv(fieldnames, rows, csvfile):
+    """Write one table as CSV to a text stream"""
+    writer = csv.writer(csvfile)
+    writer.writerow(fieldnames)
+    writer.writerows(rows)
+
+
+def build_arrow_table(fieldnames, rows):
+    """Columnar copy of a table - empty cells become nulls so columns keep one type"""
+    import pyarrow  # optional - only needed for output format 'parquet'
+    
+    columns = list(zip(*rows)) or [()] * len(fieldnames)
+    return pyarrow.table({name: [None if value == '' else value for value in column]
+                          for name, column in zip(fieldnames, columns)})
+
+
+def serialize_table(fieldnames, rows, file_format='csv', compression=None, level=None):
+    """Serialize one table into an in-memory payload (CSV optionally compressed, or parquet)"""
+    buffer = io.BytesIO()
+    
+    if file_format == 'parquet':
+        import pyarrow.parquet
+        
+        pyarrow.parquet.write_table(build_arrow_table(fieldnames, rows), buffer,
+                                    compression=compression or 'snappy', compression_level=level)
+        return buffer.getvalue()
+    
+    raw = open_compressed_writer(buffer, compression, level)
+    
+    text = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+    write_table_csv(fieldnames, rows, text)
+    text.flush()
+    text.detach()
+    
+    if raw is not buffer:
+        raw.close()
+    
+    return buffer.getvalue()
+
+
+class OutputTable:
+    """One file of a company's output (the main table or a companion one)"""
+    __slots__ = ('filename', 'path', 'payload', 'object_name')
+    
+    def __init__(self, filename):
+        self.filename = filename
+        self.path = None
+        self.payload = None
+        self.object_name = filename
+
+
+class CompanyOutput:
+    """One scraped company on its way through the write/upload stages"""
+    __slots__ = ('company_name', 'results', 'total_pages', 'truncated', 'csv_filename',
+                 'tables', 'object_name')
+    
+    def __init__(self, company_name, results, total_pages, truncated=False):
+        self.company_name = company_name
+        self.results = results
+        self.total_pages = total_pages
+        self.truncated = truncated
+        self.csv_filename = company_csv_filename(company_name)
+        self.tables = []
+        self.object_name = self.csv_filename
+    
+    @property
+    def total_officers(self):
+        return sum(len(r.officers) for r in self.results)
+    
+    @property
+    def outcome(self):
+        """What the scrape reported for this output - only PROCESSED counts as successful"""
+        return Outcome.TRUNCATED if self.truncated else Outcome.PROCESSED
+
+
+def write_company_output(output, minio_uploader=None, shard_writer=None, entity_store=None):
+    """Write stage - local copies and/or the in-memory payloads for upload"""
+    compression = OUTPUT_CONFIG.get('compression')
+    file_format = OUTPUT_CONFIG.get('format', 'csv')
+    # Without an uploader the local copy is the only copy - always keep it
+    write_local = OUTPUT_CONFIG.get('write_local', True) or not minio_uploader
+    
+    refs_only = entity_store is not None
+    if refs_only:
+        entity_store.add_search(output.company_name, output.results)
+    
+    stem = output.csv_filename[:-len('.csv')]
+    parquet = file_format == 'parquet'
+    extension = '.parquet' if parquet else '.csv'
+    # Parquet is compressed inside the file, so a local copy can be uploaded as-is
+    needs_payload = shard_writer or (minio_uploader and (not write_local or (compression and not parquet)))
+    
+    output.tables = []
+    for suffix, fieldnames, rows in result_tables(output.results, OUTPUT_CONFIG.get('layout', 'flat'),
+                                                  refs_only):
+        table = OutputTable(stem + suffix + extension)
+        output.tables.append(table)
+        
+        payload = None
+        if needs_payload or (write_local and parquet):
+            payload = serialize_table(fieldnames, rows(), file_format, compression,
+                                      OUTPUT_CONFIG.get('compression_level'))
+        
+        if write_local:
+            table.path = os.path.join(COMPANY_DATA_DIR, table.filename)
+            
+            if parquet:
+                with open(table.path, 'wb') as f:
+                    f.write(payload)
+            else:
+                with open(table.path, 'w', newline='', encoding='utf-8') as csvfile:
+                    write_table_csv(fieldnames, rows(), csvfile)
+            
+            logger.info(f"💾 Saved company data: {table.filename}")
+        
+        if needs_payload:
+            table.payload = payload
+
+
+def upload_company_output(output, minio_uploader=None, shard_writer=None):
+    """Upload stage - send the company's tables to MinIO (or into the current shard)"""
+    compression = OUTPUT_CONFIG.get('compression')
+    parquet = OUTPUT_CONFIG.get('format') == 'parquet'
+    # Parquet compresses inside the file - no object suffix or content encoding
+    suffix = '' if parquet else COMPRESSION_SUFFIXES[compression]
+    
+    if shard_writer:
+        # Bundle into the current shard - uploaded once the shard fills up, and tracked
+        # (its checkpoint cleared) only then. One company at a time keeps its tables together
+        with shard_writer.lock:
+            for table in output.tables:
+                table.object_name = shard_writer.add(output.company_name, table.filename + suffix,
+                                                     table.payload, output.truncated)
+                table.payload = None
+            output.object_name = output.tables[0].object_name if output.tables else output.csv_filename
+            shard_writer.finish_company(output)
+        return
+    
+    for table in output.tables:
+        if minio_uploader:
+            table.object_name = table.filename + suffix
+            
+            if table.payload is not None:
+                # Diskless path - stream straight from memory
+                uploaded = minio_uploader.upload_bytes(
+                    table.payload,
+                    table.object_name,
+                    content_type='application/vnd.apache.parquet' if parquet else 'text/csv',
+                    content_encoding=None if parquet else compression
+                )
+            else:
+                uploaded = minio_uploader.upload_file(table.path, table.filename)
+            
+            if not uploaded:
+                # Not tracked as processed - the checkpoint stays so the save is redone
+                raise ScrapeError(FailureKind.OTHER, f"Upload failed: {table.object_name}")
+        
+        table.payload = None
+    
+    # Tracking points at the main table - companion tables share its stem
+    output.object_name = output.tables[0].object_name if output.tables else output.csv_filename
+
+
+def record_company_output(output, tracking_csv, checkpoint_store=None):
+    """Last step - the company only counts as processed once it is saved"""
+    # ✅ ONLY LOG TO PROCESSED_CSV IF WE HAVE RESULTS
+    tracking_csv.log_processed(
+        company_name=output.company_name,
+        total_companies=len(output.results),
+        total_pages=output.total_pages,
+        total_officers=output.total_officers,
+        csv_filename=output.object_name,
+        truncated=output.truncated
+    )
+    
+    # A truncated company keeps its checkpoint - the remainder resumes from it
+    if checkpoint_store and not output.truncated:
+        checkpoint_store.clear(output.company_name)
+
+
+class EntityStore:
+    """SQLite store of every company card seen, keyed by company_url
+    
+    A company returned by many searches is stored once; each search only
+    keeps (page, position, company_url) references to it.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS companies (
+            company_url TEXT PRIMARY KEY,
+            company_name TEXT,
+            location TEXT,
+            total_officers INTEGER,
+            first_seen TEXT,
+            last_seen TEXT
+        );
+        CREATE TABLE IF NOT EXISTS officers (
+            company_url TEXT,
+            officer_url TEXT,
+            officer_name TEXT,
+            officer_id TEXT,
+            PRIMARY KEY (company_url, officer_url)
+        );
+        CREATE TABLE IF NOT EXISTS search_refs (
+            search TEXT,
+            page INTEGER,
+            result_on_page INTEGER,
+            company_url TEXT,
+            match_score REAL,
+            PRIMARY KEY (search, page, result_on_page)
+        );
+        CREATE INDEX IF NOT EXISTS search_refs_company ON search_refs (company_url);
+    """
+    
+    def __init__(self, path=ENTITY_STORE_DB):
+        self.path = path
+        # Written from the pipeline's worker threads - one writer at a time
+        self.lock = threading.Lock()
+        # Other processes (--processes) may hold the write lock for a moment
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(self.SCHEMA)
+        self.new_entities = 0
+        self.repeat_entities = 0
+    
+    def add_search(self, search, results):
+        """Upsert a search's companies/officers and replace its references"""
+        now = datetime.now().isoformat(timespec='seconds')
+        
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM search_refs WHERE search = ?', (search,))
+            
+            for result in results:
+                key = result.entity_key
+                
+                seen = self.conn.execute('SELECT 1 FROM companies WHERE company_url = ?',
+                                         (key,)).fetchone()
+                if seen:
+                    self.repeat_entities += 1
+                else:
+                    self.new_entities += 1
+                
+                # A later search has the newer card - refresh the details, keep first_seen
+                self.conn.execute(
+                    """INSERT INTO companies VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(company_url) DO UPDATE SET
+                           company_name = excluded.company_name,
+                           location = excluded.location,
+                           total_officers = excluded.total_officers,
+                           last_seen = excluded.last_seen""",
+                    (key, result.company_name, result.location, result.total_officers, now, now)
+                )
+                self.conn.executemany(
+                    """INSERT INTO officers VALUES (?, ?, ?, ?)
+                       ON CONFLICT(company_url, officer_url) DO UPDATE SET
+                           officer_name = excluded.officer_name,
+                           officer_id = excluded.officer_id""",
+                    [(key, o.url, o.name, o.entity_id) for o in result.officers]
+                )
+                
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO search_refs VALUES (?, ?, ?, ?, ?)',
+                    (search, result.page, result.result_on_page, key, result.match_score)
+                )
+    
+    def count(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM companies').fetchone()[0]
+    
+    def close(self):
+        """Close the database (folds the WAL back into the main file)"""
+        with self.lock:
+            self.conn.close()
+
+
+class ResultPipeline:
+    """Write and upload stages behind the browser workers
+    
+    Stages are joined by bounded queues. submit() waits while the write queue
+    is full, so a slow disk or slow uploads hold the browsers back instead of
+    piling finished companies up in memory.
+    """
+    
+    STAGES = ('write', 'upload')
+    
+    def __init__(self, minio_uploader, tracking_csv, shard_writer=None, checkpoint_store=None,
+                 write_workers=1, upload_workers=2, queue_size=4, entity_store=None):
+        self.minio_uploader = minio_uploader
+        self.tracking_csv = tracking_csv
+        self.shard_writer = shard_writer
+        self.checkpoint_store = checkpoint_store
+        self.entity_store = entity_store
+        self.worker_counts = {'write': write_workers, 'upload': upload_workers}
+        self.queues = {stage: asyncio.Queue(maxsize=queue_size) for stage in self.STAGES}
+        self.stats = {stage: {'done': 0, 'busy': 0.0, 'blocked': 0.0, 'max_depth': 0}
+                      for stage in self.STAGES}
+        self.failed = []
+        self.tasks = []
+    
+    def start(self):
+        for stage, next_stage in zip(self.STAGES, self.STAGES[1:] + (None,)):
+            for _ in range(max(1, self.worker_counts[stage])):
+                self.tasks.append(asyncio.create_task(self._run_stage(stage, next_stage)))
+    
+    async def submit(self, output):
+        """Hand a scraped company to the write stage - waits while the stage is full"""
+        await self._put('write', output)
+    
+    async def _put(self, stage, output):
+        queue = self.queues[stage]
+        stats = self.stats[stage]
+        
+        started = time.monotonic()
+        await queue.put(output)
+        stats['blocked'] += time.monotonic() - started
+        stats['max_depth'] = max(stats['max_depth'], queue.qsize())
+    
+    async def _run_stage(self, stage, next_stage):
+        queue = self.queues[stage]
+        stats = self.stats[stage]
+        
+        while True:
+            output = await queue.get()
+            started = time.monotonic()
+            
+            try:
+                if stage == 'write':
+                    await asyncio.to_thread(write_company_output, output, self.minio_uploader,
+                                            self.shard_writer, self.entity_store)
+                else:
+                    await self._upload(output)
+            except Exception as e:
+                # The checkpoint is kept (done) - the next run only redoes the save
+                logger.error(f"❌ {stage.capitalize()} failed for {output.company_name}: {e}")
+                self.failed.append((output, stage))
+                queue.task_done()
+                continue
+            
+            stats['busy'] += time.monotonic() - started
+            stats['done'] += 1
+            
+            if next_stage:
+                await self._put(next_stage, output)
+            queue.task_done()
+    
+    async def _upload(self, output):
+        await asyncio.to_thread(upload_company_output, output, self.minio_uploader, self.shard_writer)
+        if not self.shard_writer:
+            # Shard members are recorded by the shard writer once the shard is uploaded
+            record_company_output(output, self.tracking_csv, self.checkpoint_store)
+    
+    def depth_line(self):
+        """Current queue depths, for progress output"""
+        return ' | '.join(f"{stage} queue {self.queues[stage].qsize()}/{self.queues[stage].maxsize}"
+                          for stage in self.STAGES)
+    
+    def summary_lines(self):
+        lines = []
+        for stage in self.STAGES:
+            stats = self.stats[stage]
+            lines.append(f"{stage}: {stats['done']} done by {self.worker_counts[stage]} workers, "
+                         f"{stats['busy']:.1f}s busy, max queue {stats['max_depth']}, "
+                         f"{stats['blocked']:.1f}s waiting to enqueue")
+        return lines
+    
+    async def join(self):
+        """Wait until every queued company has been through all stages"""
+        for stage in self.STAGES:
+            await self.queues[stage].join()
+    
+    async def close(self):
+        """Let every queued company finish all stages, then stop the workers"""
+        await self.join()
+        
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+
+def parse_result_item(item):
+    """Parse one result card into a ResultRecord"""
+    
+    try:
+        result = ResultRecord()
+        
+        company_link = item.find('a', class_='ellipsis')
+        if company_link:
+            result.company_name = company_link.get_text(strip=True)
+            result.company_href = company_link.get('href', '')
+        
+        if company_link:
+            parent_div = company_link.find_parent('div', class_='col-xs-12')
+            if parent_div:
+                full_text = parent_div.get_text(strip=True)
+                location = full_text.replace(result.company_name, '').strip()
+                result.location = re.sub(r'^,\s*', '', location)
+        
+        officers_col = item.find('div', class_='col-xs-12 col-lg-7')
+        if officers_col:
+            officer_links = officers_col.find_all('a', attrs={'data-entity-id': True})
+            
+            for officer_link in officer_links:
+                result.officers.append(OfficerRecord(
+                    officer_link.get_text(strip=True),
+                    officer_link.get('href', ''),
+                    officer_link.get('data-entity-id', '')
+                ))
+        
+        return result
+        
+    except Exception as e:
+        logger.debug(f"Parse error: {e}")
+        return None
+
+
+def parse_results_html(html, page_number, parser='html.parser'):
+    """Parse a results page into compact records
+    
+    Module-level so it can run in a worker process. Returns (records, found)
+    where found is False when the page has no results container at all.
+    """
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html, parser)
+    
+    results_container = soup.find('div', {'id': 'results-details'})
+    if not results_container:
+        return [], False
+    
+    page_results = []
+    
+    for idx, item in enumerate(results_container.find_all('div', class_='list-group-item'), 1):
+        result_data = parse_result_item(item)
+        if result_data:
+            result_data.page = page_number
+            result_data.result_on_page = idx
+            page_results.append(result_data)
+    
+    return page_results, True
+
+
+# In-page extractor - mirrors parse_results_html but returns only compact arrays:
+# [[company_name, href, location, [[officer_name, href, entity_id], ...]], ...]
+# (null when the results container is missing)
+EXTRACT_RESULTS_JS = """
+() => {
+    // Same as BeautifulSoup get_text(strip=True): stripped text nodes joined with ''
+    const strippedText = (el) => {
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        let text = '';
+        while (walker.nextNode()) {
+            text += walker.currentNode.nodeValue.trim();
+        }
+        return text;
+    };
+    
+    const container = document.querySelector('div#results-details');
+    if (!container) {
+        return null;
+    }
+    
+    return Array.from(container.querySelectorAll('div.list-group-item')).map((item) => {
+        const link = item.querySelector('a.ellipsis');
+        let name = '';
+        let href = null;
+        let location = '';
+        
+        if (link) {
+            name = strippedText(link);
+            href = link.getAttribute('href') || '';
+            
+            const parent = link.parentElement && link.parentElement.closest('div.col-xs-12');
+            if (parent) {
+                location = strippedText(parent).split(name).join('').trim().replace(/^,\\s*/, '');
+            }
+        }
+        
+        const officers = [];
+        const officersCol = item.querySelector('div[class="col-xs-12 col-lg-7"]');
+        if (officersCol) {
+            for (const a of officersCol.querySelectorAll('a[data-entity-id]')) {
+                officers.push([strippedText(a), a.getAttribute('href') || '', a.getAttribute('data-entity-id') || '']);
+            }
+        }
+        
+        return [name, href, location, officers];
+    });
+}
+"""
+
+
+def records_from_extracted(data, page_number):
+    """Build ResultRecords from EXTRACT_RESULTS_JS output"""
+    return [
+        ResultRecord(name, href, location, [OfficerRecord(*o) for o in officers], page_number, idx)
+        for idx, (name, href, location, officers) in enumerate(data, 1)
+    ]
+
+
+class ExtractionStats:
+    """Bytes transferred and time spent per extraction mode"""
+    
+    def __init__(self):
+        self.modes = {}
+        self.first_at = None
+    
+    def record(self, mode, nbytes, seconds):
+        if self.first_at is None:
+            # Startup metric - when the run's first results page was extracted
+            self.first_at = time.monotonic()
+        stats = self.modes.setdefault(mode, {'pages': 0, 'bytes': 0, 'seconds': 0.0})
+        stats['pages'] += 1
+        stats['bytes'] += nbytes
+        stats['seconds'] += seconds
+    
+    def summary_lines(self):
+        lines = []
+        for mode, stats in sorted(self.modes.items()):
+            pages = stats['pages'] or 1
+            lines.append(f"{mode}: {stats['pages']} pages | {stats['bytes'] / pages / 1024:.1f}KB/page | "
+                         f"{stats['seconds'] / pages * 1000:.0f}ms/page")
+        return lines
+
+
+class CacheStats:
+    """HTTP cache hits/misses for static assets, read from CDP network events"""
+    
+    STATIC_TYPES = {'Script', 'Stylesheet', 'Font', 'Image'}
+    
+    def __init__(self):
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.missed_hosts = {}
+    
+    async def watch(self, context, page):
+        """Count the page's static asset loads (Chromium only)"""
+        session = await context.new_cdp_session(page)
+        served_from_cache = set()
+        
+        def on_served(event):
+            served_from_cache.add(event['requestId'])
+        
+        def on_response(event):
+            if event.get('type') not in self.STATIC_TYPES:
+                return
+            response = event['response']
+            if event['requestId'] in served_from_cache or response.get('fromDiskCache'):
+                self.hits += 1
+            elif response.get('status') == 304:
+                self.revalidated += 1
+            else:
+                self.misses += 1
+                host = response.get('url', '').split('/')[2:3]
+                host = host[0] if host else '?'
+                self.missed_hosts[host] = self.missed_hosts.get(host, 0) + 1
+        
+        session.on('Network.requestServedFromCache', on_served)
+        session.on('Network.responseReceived', on_response)
+        await session.send('Network.enable')
+    
+    def summary_lines(self):
+        total = self.hits + self.revalidated + self.misses
+        if not total:
+            return []
+        lines = [f"{self.hits} from cache, {self.revalidated} revalidated (304), {self.misses} downloaded "
+                 f"({self.hits / total:.0%} hit rate)"]
+        for host, count in sorted(self.missed_hosts.items(), key=lambda item: -item[1])[:5]:
+            lines.append(f"downloaded from {host}: {count}")
+        return lines
+
+
+class Account:
+    """One login - its persisted session and usage counters"""
+    
+    def __init__(self, email, password, session_dir=SESSION_DIR):
+        self.credentials = {'email': email, 'password': password}
+        self.session_path = os.path.join(session_dir, re.sub(r'[^\w.@-]', '_', email or 'default') + '.json')
+        self.active = 0
+        self.companies = 0
+        self.requests = 0
+        self.logins = 0
+        self.expiries = 0
+    
+    @property
+    def email(self):
+        return self.credentials['email']
+    
+    @property
+    def storage_state(self):
+        """Saved session file for new contexts (None before the first login)"""
+        return self.session_path if os.path.exists(self.session_path) else None
+    
+    async def save_session(self, context):
+        try:
+            await context.storage_state(path=self.session_path)
+        except Exception as e:
+            logger.debug(f"Could not save session for {self.email}: {e}")
+
+
+def load_accounts():
+    """Accounts from ACCOUNTS_FILE, or just CREDENTIALS (None if the file is unusable)"""
+    if not ACCOUNTS_FILE:
+        return [Account(CREDENTIALS['email'], CREDENTIALS['password'])]
+    
+    try:
+        with open(ACCOUNTS_FILE, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        print(f"❌ Accounts file not found: {ACCOUNTS_FILE}")
+        return None
+    except json.JSONDecodeError as e:
+        print(f"❌ Accounts file is not valid JSON: {ACCOUNTS_FILE} ({e})")
+        return None
+    
+    accounts = []
+    for index, entry in enumerate(entries if isinstance(entries, list) else [entries]):
+        if not isinstance(entry, dict) or not entry.get('email') or not entry.get('password'):
+            print(f"❌ Accounts file entry {index + 1} needs an email and a password: {ACCOUNTS_FILE}")
+            return None
+        accounts.append(Account(entry['email'], entry['password']))
+    if not accounts:
+        print(f"❌ Accounts file has no accounts: {ACCOUNTS_FILE}")
+        return None
+    return accounts
+
+
+class SessionPool:
+    """Hand out accounts to companies and keep per-account counters"""
+    
+    def __init__(self, accounts, strategy='least_loaded'):
+        if not accounts:
+            raise ValueError("Account pool is empty")
+        self.accounts = accounts
+        self.strategy = strategy
+        self.next_index = 0
+        os.makedirs(SESSION_DIR, exist_ok=True)
+    
+    def acquire(self, preferred=None):
+        """Pick an account for the next company - keeps `preferred` when it is as idle as any"""
+        if self.strategy == 'round_robin':
+            account = self.accounts[self.next_index % len(self.accounts)]
+            self.next_index += 1
+        else:
+            lowest = min(a.active for a in self.accounts)
+            if preferred is not None and preferred.active == lowest:
+                # Staying on the same account avoids a context switch
+                account = preferred
+            else:
+                account = min(self.accounts, key=lambda a: (a.active, a.requests))
+        
+        account.active += 1
+        account.companies += 1
+        return account
+    
+    def release(self, account):
+        account.active -= 1
+    
+    def summary_lines(self):
+        return [f"{a.email}: {a.companies} companies, {a.requests} requests, "
+                f"{a.logins} logins, {a.expiries} expired sessions" for a in self.accounts]
+
+
+class BrowserRecycler:
+    """Decide when a reused browser/context should be swapped out (between companies only)"""
+    
+    def __init__(self, config=None, memory_log_csv=MEMORY_LOG_CSV):
+        self.config = config or RECYCLE_CONFIG
+        self.memory_log_csv = memory_log_csv
+        self.companies_seen = 0
+        self.context_recycles = 0
+        self.browser_recycles = 0
+    
+    def log_memory_sample(self, scraper, rss_mb, reason=''):
+        """Log an RSS sample (also appended to memory_samples.csv for tuning)"""
+        logger.info(f"🧠 Memory: {rss_mb:.0f}MB RSS | context pages={scraper.context_pages} "
+                    f"companies={scraper.context_companies} | browser companies={scraper.browser_companies}"
+                    f"{' | ' + reason if reason else ''}")
+        
+        new_file = not os.path.exists(self.memory_log_csv)
+        with open(self.memory_log_csv, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(['timestamp', 'rss_mb', 'context_pages', 'context_companies',
+                                 'browser_companies', 'event'])
+            writer.writerow([datetime.now().strftime('%Y-%m-%d %H:%M:%S'), round(rss_mb, 1),
+                             scraper.context_pages, scraper.context_companies,
+                             scraper.browser_companies, reason])
+    
+    @staticmethod
+    def rss_mb(scraper):
+        """The worker's own browser - the whole tree would recycle every worker at once"""
+        rss_mb = scraper.browser_rss_mb()
+        # Only Chromium carries the marker - other engines fall back to the whole tree
+        return process_tree_rss_mb() if rss_mb is None else rss_mb
+    
+    async def before_company(self, scraper):
+        """Recycle the scraper's context or browser if a policy says so"""
+        self.companies_seen += 1
+        
+        if scraper.browser is None:
+            return
+        
+        rss_mb = self.rss_mb(scraper)
+        config = self.config
+        
+        reason = None
+        if scraper.needs_restart:
+            reason = 'browser: previous company crashed'
+        elif config.get('max_rss_mb') and rss_mb >= config['max_rss_mb']:
+            reason = f"browser: RSS {rss_mb:.0f}MB >= {config['max_rss_mb']}MB"
+        elif config.get('max_companies_per_browser') and scraper.browser_companies >= config['max_companies_per_browser']:
+            reason = f"browser: {scraper.browser_companies} companies"
+        elif config.get('max_pages_per_context') and scraper.context_pages >= config['max_pages_per_context']:
+            reason = f"context: {scraper.context_pages} pages"
+        elif config.get('max_companies_per_context') and scraper.context_companies >= config['max_companies_per_context']:
+            reason = f"context: {scraper.context_companies} companies"
+        
+        every = config.get('memory_sample_every')
+        if reason or (every and self.companies_seen % every == 0):
+            self.log_memory_sample(scraper, rss_mb, f"recycle {reason}" if reason else '')
+        
+        if not reason:
+            return
+        
+        logger.info(f"♻️  Recycling {reason}")
+        
+        if reason.startswith('browser'):
+            await scraper.restart_browser()
+            self.browser_recycles += 1
+        else:
+            await scraper.recycle_context()
+            self.context_recycles += 1
+        
+        self.log_memory_sample(scraper, self.rss_mb(scraper), 'after recycle')
+
+
+class PagePrefetcher:
+    """Keep the next few results pages loading on spare tabs
+    
+    Pages are opened by URL (page_param) and handed out strictly in page
+    order, so results and checkpoints stay ordered. The tab being parsed is
+    only reused once the page after it has been taken.
+    """
+    
+    def __init__(self, scraper, depth, last_page=None):
+        self.scraper = scraper
+        self.depth = depth
+        self.last_page = last_page
+        self.tabs = []
+        self.free_tabs = []
+        self.pending = {}
+        self.next_page = None
+        self.current_tab = None
+        self.misaligned = False
+        self.ready = 0
+        self.waited = 0
+    
+    async def start(self):
+        """Start loading the pages after scraper.current_page"""
+        # depth tabs loading ahead + one holding the page being parsed
+        for _ in range(self.depth + 1):
+            tab = await self.scraper.new_tab()
+            self.tabs.append(tab)
+            self.free_tabs.append(tab)
+        
+        self.current_tab = self.scraper.page
+        self.next_page = self.scraper.current_page + 1
+        self.schedule()
+    
+    def schedule(self):
+        while self.free_tabs and (self.last_page is None or self.next_page <= self.last_page):
+            tab = self.free_tabs.pop()
+            self.pending[self.next_page] = asyncio.create_task(self.load(tab, self.next_page))
+            self.next_page += 1
+    
+    async def load(self, tab, page_number):
+        """Open one page on a tab - goes through the shared rate limiter and retries"""
+        url = self.scraper.search_url(self.scraper.current_query, page_number)
+        
+        async def open_page(attempt):
+            await self.scraper.goto_results(url, tab)
+        
+        # Failures only count once the page is actually needed (see take)
+        await self.scraper.with_retries(open_page, f"Prefetch page {page_number}", track_failure=False)
+        
+        try:
+            await tab.wait_for_selector('.list-group-item', timeout=BROWSER_CONFIG['next_page_timeout_ms'])
+        except Exception:
+            # Pages past the end have no results - only an error if we get there
+            pass
+        
+        return tab
+    
+    async def take(self):
+        """Tab holding the page after the current one - None on the last page or on failure"""
+        scraper = self.scraper
+        
+        try:
+            if await scraper.is_last_page(self.current_tab):
+                logger.info("✅ Last page reached")
+                return None
+        except Exception as e:
+            scraper.last_failure = classify_error(e)
+            logger.error(f"❌ Could not read pager ({scraper.last_failure}): {e}")
+            return None
+        
+        page_number = scraper.current_page + 1
+        task = self.pending.pop(page_number, None)
+        if task is None:
+            return None
+        
+        if task.done():
+            self.ready += 1
+        else:
+            self.waited += 1
+        
+        try:
+            tab = await task
+        except Exception as e:
+            scraper.last_failure = classify_error(e)
+            logger.error(f"❌ Page {page_number} failed ({scraper.last_failure}): {e}")
+            return None
+        
+        position = await scraper.pager_position(tab)
+        if position is not None and position != page_number:
+            # The site ignored the page parameter - parsing this tab would repeat rows
+            logger.warning(f"⚠️  Prefetched tab shows page {position}, not {page_number} - clicking through instead")
+            self.misaligned = True
+            self.free_tabs.append(tab)
+            return None
+        
+        if self.current_tab is not scraper.page:
+            self.free_tabs.append(self.current_tab)
+        self.current_tab = tab
+        scraper.current_page = page_number
+        log_page_event(page_number, "➡️  Page %d (prefetched)", page_number, query=scraper.current_query)
+        
+        self.schedule()
+        return tab
+    
+    async def close(self):
+        """Cancel outstanding loads and close the extra tabs"""
+        for task in self.pending.values():
+            task.cancel()
+        await asyncio.gather(*self.pending.values(), return_exceptions=True)
+        self.pending.clear()
+        
+        for tab in self.tabs:
+            try:
+                await tab.close()
+            except Exception:
+                pass
+        
+        if self.ready or self.waited:
+            logger.info(f"📑 Prefetch: {self.ready} pages ready, {self.waited} waited on")
+
+
+class FastCorporationWikiScraper:
+    """Optimized scraper with minimal delays"""
+    
+    def __init__(self, credentials, checkpoint_store=None, stop_event=None, retry_policy=None,
+                 breaker=None, parse_executor=None, extraction_stats=None, rate_limiter=None,
+                 profile_dir=None, cache_stats=None):
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.playwright = None
+        self.credentials = credentials
+        self.account = None
+        self.checkpoint_store = checkpoint_store
+        self.stop_event = stop_event
+        self.interrupted = False
+        self.truncated = False
+        self.deadline = None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker
+        self.parse_executor = parse_executor
+        self.extraction_stats = extraction_stats
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache_stats = cache_stats
+        # Persistent profiles are Chromium-only (disk cache flags and CDP counters)
+        self.profile_dir = profile_dir
+        # Ignored by Chromium - tells this scraper's browser processes apart from the other workers'
+        self.browser_marker = f"--corpwikiscrap-browser={os.getpid()}-{id(self)}"
+        self.persistent = bool(profile_dir and BROWSER_CONFIG.get('persistent_profile')
+                               and BROWSER_CONFIG.get('engine', 'chromium') == 'chromium')
+        self.last_failure = None
+        self.current_query = None
+        self.needs_restart = False
+        self.context_pages = 0
+        self.context_companies = 0
+        self.browser_companies = 0
+        self.all_results = []
+        self.current_page = 1
+        self.is_logged_in = False
+        self.auth_handled = False
+    
+    async def setup(self):
+        """Setup browser - optimized"""
+        await self.start_browser()
+        await self.new_context()
+    
+    async def ensure_ready(self):
+        """Start the browser/context lazily (for a scraper reused across companies)"""
+        if self.browser is None:
+            await self.start_browser()
+        if self.context is None:
+            await self.new_context()
+    
+    async def start_browser(self):
+        """Launch Playwright and Chromium"""
+        logger.info("🚀 Starting browser...")
+        
+        from playwright.async_api import async_playwright
+        
+        self.playwright = await async_playwright().start()
+        
+        self.browser_companies = 0
+        self.needs_restart = False
+        
+        if self.persistent:
+            # The profile is launched by new_context - a persistent context is its own browser
+            return
+        
+        engine = BROWSER_CONFIG.get('engine', 'chromium')
+        self.browser = await getattr(self.playwright, engine).launch(
+            headless=BROWSER_CONFIG.get('headless', True),
+            args=self.launch_args(engine) + ([self.browser_marker] if engine == 'chromium' else [])
         )
+    
+    @staticmethod
+    def launch_args(engine='chromium'):
+        if engine != 'chromium':
+            return []
+        return [
+            '--disable-blink-features=AutomationControlled',
+            '--no-sandbox',
+            '--disable-dev-shm-usage',
+            '--disable-gpu',
+            '--disable-software-rasterizer',
+        ]
+    
+    def browser_rss_mb(self):
+        """RSS of this scraper's own browser process tree (None if it can't be found)"""
+        pids = pids_with_arg(self.browser_marker)
+        return process_tree_rss_mb(pids) if pids else None
+    
+    async def open_profile(self, storage_state=None):
+        """Launch (or reuse) the persistent profile and load the account's cookies into it"""
+        if self.context is None:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            self.context = await self.playwright.chromium.launch_persistent_context(
+                self.profile_dir,
+                headless=BROWSER_CONFIG.get('headless', True),
+                args=self.launch_args() + [
+                    self.browser_marker,
+                    f"--disk-cache-size={BROWSER_CONFIG.get('disk_cache_mb', 256) * 1024 * 1024}",
+                    '--blink-settings=imagesEnabled=false',
+                ],
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            )
+            # Closing a persistent context shuts Chromium down - it stands in for the browser
+            self.browser = self.context
+            logger.info(f"🗂️  Profile: {self.profile_dir}")
+        
+        for page in self.context.pages:
+            await page.close()
+        
+        # The profile keeps cookies between runs - only the current account's session may stay
+        await self.context.clear_cookies()
+        if isinstance(storage_state, str):
+            with open(storage_state, 'r', encoding='utf-8') as f:
+                storage_state = json.load(f)
+        if storage_state and storage_state.get('cookies'):
+            await self.context.add_cookies(storage_state['cookies'])
+        
+        # add_cookies has no local storage counterpart - write it from a page on each origin
+        origins = (storage_state or {}).get('origins') or []
+        if origins:
+            page = await self.context.new_page()
+            try:
+                for entry in origins:
+                    await page.goto(entry['origin'], wait_until='commit')
+                    await page.evaluate("""items => {
+                        localStorage.clear();
+                        for (const {name, value} of items) localStorage.setItem(name, value);
+                    }""", entry.get('localStorage', []))
+            except Exception as e:
+                logger.debug(f"Could not restore local storage: {e}")
+            finally:
+                await page.close()
+    
+    async def new_context(self, storage_state=None):
+        """Open a fresh context + page (optionally restoring a logged-in session)"""
+        if storage_state is None and self.account:
+            storage_state = self.account.storage_state
+        
+        if self.persistent:
+            await self.open_profile(storage_state)
+        else:
+            self.context = await self.browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                storage_state=storage_state,
+            )
         
-        self.page = await self.context.new_page()
+        self.context_pages = 0
+        self.context_companies = 0
+        
+        self.page = await self.new_tab()
+        
+        logger.info("✅ Browser ready")
+    
+    async def new_tab(self):
+        """Open a page in the current context with the usual blocking/stealth setup"""
+        page = await self.context.new_page()
         
-        # Disable images and fonts for faster loading
-        await self.page.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf,eot}", lambda route: route.abort())
+        if self.persistent:
+            # No page.route here - interception would bypass the profile's HTTP cache
+            if self.cache_stats:
+                try:
+                    await self.cache_stats.watch(self.context, page)
+                except Exception as e:
+                    logger.debug(f"Cache counters unavailable: {e}")
+        else:
+            # Disable images and fonts for faster loading
+            await page.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf,eot}", lambda route: route.abort())
         
-        await self.page.add_init_script("""
+        await page.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
         """)
         
-        logger.info("✅ Browser ready")
+        return page
+    
+    async def use_account(self, account):
+        """Switch to an account - its saved session is loaded into a new context (or the profile)"""
+        if account is self.account:
+            return
+        
+        if self.account and self.context:
+            if self.is_logged_in:
+                await self.account.save_session(self.context)
+            if not self.persistent:
+                try:
+                    await self.context.close()
+                except Exception:
+                    pass
+                self.context = None
+                self.page = None
+        
+        self.account = account
+        self.credentials = account.credentials
+        self.is_logged_in = self.auth_handled = account.storage_state is not None
+        
+        if self.persistent and self.context:
+            # Closing the profile would shut Chromium down - swap the session in place
+            await self.new_context(account.storage_state)
+    
+    def count_request(self):
+        self.context_pages += 1
+        if self.account:
+            self.account.requests += 1
+    
+    async def save_session(self):
+        """Snapshot cookies/local storage so a new context stays logged in"""
+        try:
+            return await self.context.storage_state()
+        except Exception as e:
+            logger.debug(f"Could not save session: {e}")
+            return None
+    
+    async def recycle_context(self):
+        """Swap the context for a fresh one, keeping the login session"""
+        storage_state = await self.save_session() if self.context else None
+        
+        try:
+            if self.context:
+                await self.context.close()
+        except Exception:
+            pass
+        
+        self.context = None
+        self.page = None
+        
+        if storage_state is None:
+            self.is_logged_in = False
+            self.auth_handled = False
+        
+        await self.new_context(storage_state)
+    
+    async def restart_browser(self):
+        """Relaunch the whole browser, keeping the login session when possible"""
+        storage_state = None
+        if self.context and not self.needs_restart:
+            storage_state = await self.save_session()
+        
+        await self.close()
+        self.context = self.browser = self.playwright = self.page = None
+        
+        if storage_state is None:
+            self.is_logged_in = False
+            self.auth_handled = False
+        
+        await self.start_browser()
+        await self.new_context(storage_state)
+    
+    async def with_retries(self, operation, description, track_failure=True):
+        """Run a navigation step, retrying transient failures with backoff
+        
+        The final error is re-raised; its kind is kept in self.last_failure
+        (unless track_failure is off, e.g. for speculative prefetches).
+        """
+        attempt = 1
+        
+        while True:
+            if self.breaker:
+                await self.breaker.wait_if_open()
+            
+            try:
+                result = await operation(attempt)
+                if self.breaker:
+                    self.breaker.record_success()
+                return result
+                
+            except Exception as e:
+                kind = classify_error(e)
+                transient = is_transient(e)
+                
+                if transient and self.breaker:
+                    self.breaker.record_failure()
+                
+                if not transient or attempt >= self.retry_policy.max_attempts:
+                    if track_failure:
+                        self.last_failure = kind
+                    raise
+                
+                delay = self.retry_policy.delay(attempt)
+                logger.warning(f"⚠️  {description} failed ({kind}) - retry {attempt}/"
+                               f"{self.retry_policy.max_attempts - 1} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+    
+    def search_url(self, search_term, page=1):
+        """Build the results URL for a term (and page)"""
+        search_url = f"{BASE_URL}/search/results?term={quote_plus(search_term)}"
+        if page > 1:
+            search_url += f"&{PAGINATION_CONFIG['page_param']}={page}"
+        return search_url
     
-    async def search(self, search_term):
+    async def goto_results(self, search_url, page=None):
+        """Open a results URL (on self.page or another tab) - raises ScrapeError on HTTP errors"""
+        await self.rate_limiter.acquire()
+        response = await (page or self.page).goto(search_url, wait_until='domcontentloaded',
+                                                  timeout=BROWSER_CONFIG['nav_timeout_ms'])
+        self.count_request()
+        
+        if response is not None and response.status >= 400:
+            raise ScrapeError(FailureKind.HTTP_ERROR, f"HTTP {response.status}", status=response.status)
+        
+        return response
+    
+    async def search(self, search_term, page=1):
         """Search for a term - optimized"""
         logger.info(f"🔍 Searching: {search_term}")
         
+        self.current_query = search_term
+        self.last_failure = None
+        search_url = self.search_url(search_term, page)
+        
         try:
-            encoded_term = search_term.replace(' ', '+')
-            search_url = f"https://www.corporationwiki.com/search/results?term={encoded_term}"
-            
-            await self.page.goto(search_url, wait_until='domcontentloaded', timeout=20000)
+            await self.with_retries(lambda attempt: self.goto_results(search_url), "Search")
             
             # Wait for results or auth modal (whichever comes first)
             try:
-                await self.page.wait_for_selector('.list-group-item, .modal-dialog', timeout=5000)
+                await self.page.wait_for_selector('.list-group-item, .modal-dialog',
+                                                  timeout=BROWSER_CONFIG['results_timeout_ms'])
             except:
                 pass
             
-            logger.info("✅ Page loaded")
+            log_page_event(page, "✅ Page %d loaded", page, query=search_term)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Search failed: {e}")
+            logger.error(f"❌ Search failed ({self.last_failure}): {e}")
             return False
     
     async def handle_auth_if_needed(self):
@@ -241,7 +2616,7 @@ class FastCorporationWikiScraper:
                 return True
         
         try:
-            logger.info("🔐 Checking for auth popup...")
+            logger.debug("🔐 Checking for auth popup...")
             await asyncio.sleep(1)
             
             modal_visible = False
@@ -258,9 +2633,14 @@ class FastCorporationWikiScraper:
                     continue
             
             if not modal_visible:
-                logger.info("ℹ️  No auth popup")
+                logger.debug("ℹ️  No auth popup")
                 return False
             
+            if self.is_logged_in and self.account:
+                # We had a session and got the login modal anyway - it expired
+                self.account.expiries += 1
+                logger.warning(f"🔑 Session expired for {self.account.email} - signing in again")
+            
             content = await self.page.content()
             
             if 'confirm password' in content.lower() or 'register for a free account' in content.lower():
@@ -289,16 +2669,25 @@ class FastCorporationWikiScraper:
                 
                 if not clicked:
                     logger.error("❌ Could not find sign-in link")
+                    self.last_failure = FailureKind.AUTH_WALL
                     return False
                 
                 await asyncio.sleep(2)
             else:
                 logger.info("📝 Already on SIGN IN modal")
             
-            return await self.fill_and_submit_login()
+            logged_in = await self.fill_and_submit_login()
+            if not logged_in:
+                self.last_failure = FailureKind.AUTH_WALL
+            elif self.account:
+                # Persist right away - new contexts for this account start signed in
+                self.account.logins += 1
+                await self.account.save_session(self.context)
+            return logged_in
             
         except Exception as e:
             logger.error(f"❌ Auth error: {e}")
+            self.last_failure = FailureKind.AUTH_WALL
             return False
     
     async def fill_and_submit_login(self):
@@ -390,7 +2779,7 @@ class FastCorporationWikiScraper:
             return False
     
     async def click_next_page(self):
-        """Fast next page navigation"""
+        """Fast next page navigation - False on the last page or on failure (see last_failure)"""
         
         try:
             next_link = await self.page.query_selector('#search_pager li:last-child a')
@@ -405,369 +2794,1427 @@ class FastCorporationWikiScraper:
                 logger.info("✅ Last page reached")
                 return False
             
-            await next_link.click()
-            await self.page.wait_for_selector('.list-group-item', timeout=10000)
-            
-            self.current_page += 1
-            logger.info(f"➡️  Page {self.current_page}")
+        except Exception as e:
+            self.last_failure = classify_error(e)
+            logger.error(f"❌ Could not read pager ({self.last_failure}): {e}")
+            return False
+        
+        target_page = self.current_page + 1
+        
+        async def advance(attempt):
+            if attempt == 1 or not self.current_query:
+                await self.rate_limiter.acquire()
+                await next_link.click()
+                self.count_request()
+            else:
+                # Retry by URL so a half-finished click can never skip a page
+                await self.goto_results(self.search_url(self.current_query, target_page))
+                position = await self.pager_position()
+                if position is not None and position != target_page:
+                    raise ScrapeError(FailureKind.OTHER, f"Pager landed on page {position}")
             
+            await self.page.wait_for_selector('.list-group-item', timeout=BROWSER_CONFIG['next_page_timeout_ms'])
+        
+        try:
+            await self.with_retries(advance, f"Page {target_page}")
+        except Exception as e:
+            logger.error(f"❌ Page {target_page} failed ({self.last_failure}): {e}")
+            return False
+        
+        self.current_page = target_page
+        log_page_event(self.current_page, "➡️  Page %d", self.current_page, query=self.current_query)
+        
+        return True
+    
+    async def is_last_page(self, page=None):
+        """True when the pager's "next" link is missing or disabled"""
+        next_link = await (page or self.page).query_selector('#search_pager li:last-child a')
+        
+        if not next_link:
             return True
-            
+        
+        parent_li = await next_link.evaluate_handle('a => a.closest("li")')
+        return await parent_li.evaluate('li => li.classList.contains("disabled")')
+    
+    async def reached_end(self):
+        """True when pagination ended cleanly - no failure and the pager's "next" is disabled"""
+        if self.last_failure:
+            return False
+        try:
+            return await self.is_last_page()
         except Exception as e:
-            logger.debug(f"Next page failed: {e}")
+            self.last_failure = classify_error(e)
             return False
     
-    async def scrape_current_page(self):
-        """Fast scraping - parse HTML directly"""
+    async def pager_position(self, page=None):
+        """Read the active page number from the pager (None if unknown)"""
+        try:
+            text = await (page or self.page).inner_text('#search_pager li.active', timeout=2000)
+            return int(text.strip())
+        except Exception:
+            return None
+    
+    async def seek_page(self, target_page):
+        """Make sure the browser is on target_page - click through if the URL jump didn't land"""
+        position = await self.pager_position()
+        
+        if position == target_page:
+            self.current_page = target_page
+            return True
+        
+        logger.info(f"⏩ Pager at {position or 1}, clicking through to page {target_page}")
+        self.current_page = position or 1
+        
+        while self.current_page < target_page:
+            await self.handle_auth_if_needed()
+            if not await self.click_next_page():
+                return False
+        
+        return True
+    
+    async def extract_html(self, page=None):
+        """Ship the whole DOM to Python and parse it there"""
+        content = await (page or self.page).content()
+        parser = PARSE_CONFIG.get('parser', 'html.parser')
+        
+        if self.parse_executor:
+            # Parse off the event loop - other pages keep navigating meanwhile
+            loop = asyncio.get_running_loop()
+            page_results, found = await loop.run_in_executor(
+                self.parse_executor, parse_results_html, content, self.current_page, parser
+            )
+        else:
+            page_results, found = parse_results_html(content, self.current_page, parser)
+        
+        return page_results, found, len(content.encode('utf-8'))
+    
+    async def extract_in_page(self, page=None):
+        """Run the extractor inside the page - only compact JSON crosses CDP"""
+        data = await (page or self.page).evaluate(EXTRACT_RESULTS_JS)
+        
+        if data is None:
+            return [], False, 4
+        
+        nbytes = len(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        return records_from_extracted(data, self.current_page), True, nbytes
+    
+    async def extract_page(self, mode, page=None):
+        """Extract with one mode, recording bytes/time for the benchmark"""
+        started = time.perf_counter()
+        
+        if mode == 'evaluate':
+            page_results, found, nbytes = await self.extract_in_page(page)
+        else:
+            page_results, found, nbytes = await self.extract_html(page)
+        
+        if self.extraction_stats:
+            self.extraction_stats.record(mode, nbytes, time.perf_counter() - started)
+        
+        return page_results, found
+    
+    async def scrape_current_page(self, page=None):
+        """Fast scraping - extract results from the current page (or a prefetch tab)"""
         
         try:
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            results_container = soup.find('div', {'id': 'results-details'})
-            if not results_container:
-                return []
+            mode = PARSE_CONFIG.get('mode', 'html')
+            page_results, found = await self.extract_page(mode, page)
             
-            result_items = results_container.find_all('div', class_='list-group-item')
+            if PARSE_CONFIG.get('benchmark'):
+                # Same page through the other path - results are discarded
+                await self.extract_page('html' if mode == 'evaluate' else 'evaluate', page)
             
-            if not result_items:
+            if not found:
+                # No results markup at all - different from an empty result list
+                self.last_failure = FailureKind.PARSE_EMPTY
                 return []
             
-            logger.info(f"📋 Page {self.current_page}: {len(result_items)} results")
-            
-            page_results = []
+            if not page_results:
+                return []
             
-            for idx, item in enumerate(result_items, 1):
-                result_data = self.parse_result_fast(item)
-                if result_data:
-                    result_data['page'] = self.current_page
-                    result_data['result_on_page'] = idx
-                    page_results.append(result_data)
+            log_page_event(self.current_page, "📋 Page %d: %d results", self.current_page, len(page_results),
+                           query=self.current_query, results=len(page_results))
             
             return page_results
             
         except Exception as e:
             logger.error(f"❌ Scraping error: {e}")
+            self.last_failure = FailureKind.PARSE_EMPTY
             return []
     
     def parse_result_fast(self, item):
         """Fast result parsing"""
+        return parse_result_item(item)
+    
+    def score_page(self, results, query):
+        """Record each result's relevance to the query, returns the page's best score"""
+        scores = score_names(query, [r.company_name for r in results])
         
-        try:
-            result = {
-                'company_name': '',
-                'company_url': '',
-                'location': '',
-                'officers': [],
-                'total_officers': 0
-            }
-            
-            company_link = item.find('a', class_='ellipsis')
-            if company_link:
-                result['company_name'] = company_link.get_text(strip=True)
-                result['company_url'] = urljoin('https://www.corporationwiki.com', company_link.get('href', ''))
-            
-            if company_link:
-                parent_div = company_link.find_parent('div', class_='col-xs-12')
-                if parent_div:
-                    full_text = parent_div.get_text(strip=True)
-                    location = full_text.replace(result['company_name'], '').strip()
-                    result['location'] = re.sub(r'^,\s*', '', location)
-            
-            officers_col = item.find('div', class_='col-xs-12 col-lg-7')
-            if officers_col:
-                officer_links = officers_col.find_all('a', attrs={'data-entity-id': True})
-                
-                for officer_link in officer_links:
-                    officer_name = officer_link.get_text(strip=True)
-                    officer_url = urljoin('https://www.corporationwiki.com', officer_link.get('href', ''))
-                    officer_id = officer_link.get('data-entity-id', '')
-                    
-                    result['officers'].append({
-                        'name': officer_name,
-                        'url': officer_url,
-                        'entity_id': officer_id
-                    })
-                
-                result['total_officers'] = len(result['officers'])
-            
-            return result
-            
-        except Exception as e:
-            logger.debug(f"Parse error: {e}")
-            return None
+        for result, score in zip(results, scores):
+            result.match_score = score
+        
+        return max(scores, default=0.0)
+    
+    def is_page_relevant(self, results, query, page_count):
+        """Score a page and decide whether pagination should continue"""
+        if not query or not RELEVANCE_CONFIG.get('enabled'):
+            return True
+        
+        best_score = self.score_page(results, query)
+        
+        if page_count < RELEVANCE_CONFIG.get('min_pages', 1):
+            return True
+        
+        if best_score < RELEVANCE_CONFIG['threshold']:
+            logger.info(f"🛑 Page {self.current_page} below relevance threshold "
+                        f"({best_score:.0f} < {RELEVANCE_CONFIG['threshold']:.0f}) - stopping")
+            return False
+        
+        return True
+    
+    def checkpoint_page(self, checkpoint_key, results):
+        """Persist a completed page so a crash doesn't lose it"""
+        if self.checkpoint_store and checkpoint_key:
+            self.checkpoint_store.write_page(checkpoint_key, self.current_page, results)
+    
+    async def stop_prefetching(self, prefetcher):
+        """Fall back to click-through - the tab holding the current page becomes self.page"""
+        current_tab = prefetcher.current_tab
+        if current_tab is not self.page:
+            prefetcher.tabs.remove(current_tab)
+            old_page, self.page = self.page, current_tab
+            try:
+                await old_page.close()
+            except Exception:
+                pass
+        
+        await prefetcher.close()
     
-    async def scrape_all_pages_fast(self):
-        """Fast pagination - scrape all pages"""
+    async def scrape_all_pages_fast(self, query=None, checkpoint_key=None, resume=None):
+        """Fast pagination - scrape all pages (or until results stop being relevant)
+        
+        With a resume state the browser must already be on the page after the
+        last checkpointed one; previously checkpointed results are kept.
+        If pagination ends because of a failure, self.last_failure holds its
+        kind and the checkpoint is left open so the company can be retried.
+        Past self.deadline it stops with self.truncated set (checkpoint open too).
+        """
         
         logger.info("🚀 Fast scraping started")
         
-        self.all_results = []
-        self.current_page = 1
+        self.all_results = list(resume['results']) if resume else []
+        self.current_page = resume['last_page'] + 1 if resume else 1
+        self.interrupted = False
+        self.truncated = False
+        self.last_failure = None
         
         await self.handle_auth_if_needed()
         
         results = await self.scrape_current_page()
         if not results:
-            logger.error("❌ No results on first page")
+            if self.all_results:
+                self.current_page -= 1
+                if await self.reached_end():
+                    # The checkpointed page was the last one
+                    if self.checkpoint_store and checkpoint_key:
+                        self.checkpoint_store.mark_done(checkpoint_key)
+                    return self.all_results
+                
+                # Auth wall, timeout or an empty page mid-search - the checkpoint stays open
+                self.last_failure = self.last_failure or FailureKind.PARSE_EMPTY
+                logger.error(f"❌ No results after the checkpointed page {self.current_page} "
+                             f"({self.last_failure})")
+                return self.all_results
+            
+            logger.error(f"❌ No results on first page ({self.last_failure or 'empty'})")
             return []
         
+        self.last_failure = None
         self.all_results.extend(results)
-        logger.info(f"✅ Page 1: {len(results)} results")
+        self.checkpoint_page(checkpoint_key, results)
+        log_page_event(self.current_page, "✅ Page %d: %d results", self.current_page, len(results),
+                       query=self.current_query, results=len(results))
         
         page_count = 1
         
-        while True:
-            await self.handle_auth_if_needed()
+        relevant = self.is_page_relevant(results, query, page_count)
+        
+        max_pages = PAGINATION_CONFIG.get('max_pages')
+        prefetcher = None
+        
+        depth = PAGINATION_CONFIG.get('prefetch_depth') or 0
+        if depth and self.current_query and relevant and not (max_pages and page_count >= max_pages):
+            last_page = self.current_page + max_pages - page_count if max_pages else None
+            prefetcher = PagePrefetcher(self, depth, last_page)
+            try:
+                await prefetcher.start()
+            except Exception as e:
+                logger.warning(f"⚠️  Prefetch unavailable, clicking through instead: {e}")
+                await prefetcher.close()
+                prefetcher = None
+        
+        try:
+            while relevant:
+                if max_pages and page_count >= max_pages:
+                    logger.info(f"✅ Page limit reached ({max_pages})")
+                    break
+                
+                if self.stop_event and self.stop_event.is_set():
+                    logger.warning(f"🛑 Shutdown requested - stopping after page {self.current_page} (checkpointed)")
+                    self.interrupted = True
+                    return self.all_results
+                
+                if self.deadline and time.monotonic() >= self.deadline:
+                    logger.warning(f"⏰ Time budget used up - stopping after page {self.current_page} "
+                                   f"(remainder queued)")
+                    self.truncated = True
+                    return self.all_results
+                
+                tab = None
+                if prefetcher:
+                    # Prefetch tabs share the context's cookies - login happened on the first page
+                    auth_failure = None
+                    tab = await prefetcher.take()
+                    if tab is None and not prefetcher.misaligned:
+                        break
+                    if tab is None:
+                        await self.stop_prefetching(prefetcher)
+                        prefetcher = None
+                
+                if not prefetcher:
+                    await self.handle_auth_if_needed()
+                    auth_failure, self.last_failure = self.last_failure, None
+                    
+                    if not await self.click_next_page():
+                        break
+                
+                results = await self.scrape_current_page(tab)
+                if not results:
+                    # An auth wall explains an empty page better than the parser does
+                    self.last_failure = auth_failure or self.last_failure
+                    break
+                
+                self.all_results.extend(results)
+                self.checkpoint_page(checkpoint_key, results)
+                page_count += 1
+                
+                if not self.is_page_relevant(results, query, page_count):
+                    break
+                
+                await asyncio.sleep(PAGINATION_CONFIG['page_delay'])
+        finally:
+            if prefetcher:
+                await prefetcher.close()
+        
+        if self.last_failure:
+            logger.warning(f"⚠️  Pagination stopped at page {self.current_page} ({self.last_failure})")
+            return self.all_results
+        
+        if self.checkpoint_store and checkpoint_key:
+            self.checkpoint_store.mark_done(checkpoint_key)
+        
+        logger.info(f"✅ COMPLETE: {page_count} pages, {len(self.all_results)} total results")
+        
+        return self.all_results
+    
+    async def close(self):
+        """Cleanup"""
+        try:
+            if self.context:
+                await self.context.close()
+            if self.browser and self.browser is not self.context:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+        except:
+            pass
+
+
+def read_companies_from_csv(csv_path):
+    """Read companies from CSV"""
+    companies = []
+    
+    try:
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
             
-            if not await self.click_next_page():
-                break
+            for row in reader:
+                if 'title' in row and row['title']:
+                    companies.append(row['title'].strip())
+        
+        logger.info(f"📊 Loaded {len(companies)} companies from {csv_path}")
+        return companies
+        
+    except Exception as e:
+        logger.error(f"❌ Error reading CSV: {e}")
+        return []
+
+
+def title_crc(title):
+    """crc32 of a normalized title - a different crc for a known CIK means a rename"""
+    return zlib.crc32(' '.join(title.split()).casefold().encode('utf-8'))
+
+
+class CikSet:
+    """Sorted on-disk set of scraped CIKs, each with its title's crc32
+    
+    Stored as two parallel little-endian uint32 arrays (8 bytes per company),
+    so lookups are a bisect and the SEC list fits in well under a megabyte.
+    """
+    
+    MAGIC = b'CIK1'
+    
+    def __init__(self, path=CIK_SET_FILE):
+        self.path = path
+        self.added = {}
+        self.loaded = os.path.exists(path)
+        self.ciks, self.crcs = self._read(path)
+    
+    @classmethod
+    def _read(cls, path):
+        ciks, crcs = array('I'), array('I')
+        if not os.path.exists(path):
+            return ciks, crcs
+        
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:4] != cls.MAGIC:
+            raise ValueError(f"Not a CIK set file: {path}")
+        
+        half = (len(data) - 4) // 2
+        ciks.frombytes(data[4:4 + half])
+        crcs.frombytes(data[4 + half:])
+        if sys.byteorder == 'big':
+            ciks.byteswap()
+            crcs.byteswap()
+        return ciks, crcs
+    
+    def __len__(self):
+        return len(self.ciks)
+    
+    def lookup(self, cik):
+        """Title crc recorded for a CIK (None if it was never scraped)"""
+        if cik in self.added:
+            return self.added[cik]
+        index = bisect.bisect_left(self.ciks, cik)
+        if index < len(self.ciks) and self.ciks[index] == cik:
+            return self.crcs[index]
+        return None
+    
+    def status(self, cik, title):
+        """'new', 'renamed' or 'unchanged'"""
+        crc = self.lookup(cik)
+        if crc is None:
+            return 'new'
+        return 'unchanged' if crc == title_crc(title) else 'renamed'
+    
+    def add(self, cik, title):
+        self.added[cik] = title_crc(title)
+    
+    def save(self):
+        """Merge this run's CIKs into the file - re-read under a lock since shard processes share it"""
+        if not self.added:
+            return 0
+        
+        with open(self.path + '.lock', 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
             
-            results = await self.scrape_current_page()
-            if not results:
-                break
+            ciks, crcs = self._read(self.path)
+            merged = dict(zip(ciks, crcs))
+            merged.update(self.added)
             
-            self.all_results.extend(results)
-            page_count += 1
+            self.ciks = array('I', sorted(merged))
+            self.crcs = array('I', (merged[cik] for cik in self.ciks))
             
-            await asyncio.sleep(0.5)
+            ciks, crcs = array('I', self.ciks), array('I', self.crcs)
+            if sys.byteorder == 'big':
+                ciks.byteswap()
+                crcs.byteswap()
+            
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(self.MAGIC + ciks.tobytes() + crcs.tobytes())
+            os.replace(tmp_path, self.path)
+        
+        saved = len(self.added)
+        self.added = {}
+        self.loaded = True
+        return saved
+
+
+def diff_input(csv_path, cik_set, seed_titles=()):
+    """Stream the input CSV against the CIK set (--delta)
+    
+    Returns (titles to scrape, {title: [cik, ...]} for them, counts). New and
+    renamed CIKs are scraped; rows without a usable cik_str always are. With
+    seed_titles (first delta run) new CIKs whose title is already tracked as
+    done are recorded instead of scraped.
+    """
+    companies = []
+    ciks_by_title = {}
+    counts = {'new': 0, 'renamed': 0, 'unchanged': 0, 'seeded': 0, 'no_cik': 0}
+    
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            title = (row.get('title') or '').strip()
+            if not title:
+                continue
+            
+            try:
+                cik = int(row.get('cik_str') or '')
+            except ValueError:
+                cik = None
+            if cik is None or not 0 <= cik < 2 ** 32:
+                counts['no_cik'] += 1
+                companies.append(title)
+                continue
+            
+            status = cik_set.status(cik, title)
+            if status == 'new' and title in seed_titles:
+                cik_set.add(cik, title)
+                status = 'seeded'
+            
+            counts[status] += 1
+            if status in ('unchanged', 'seeded'):
+                continue
+            
+            companies.append(title)
+            ciks_by_title.setdefault(title, []).append(cik)
+    
+    logger.info(f"📊 Delta: {len(companies)} of {sum(counts.values())} companies to scrape from {csv_path}")
+    return companies, ciks_by_title, counts
+
+
+def tracked_done_titles():
+    """Companies the tracking files record as finished (saved in full, or no results)"""
+    # A truncated save is not done yet - its checkpoint makes it resumable
+    done = {row['company_name'] for row in read_tracking_rows(PROCESSED_CSV) if row.get('truncated') != '1'}
+    done.update(row['company_name'] for row in read_tracking_rows(UNPROCESSED_CSV))
+    return done
+
+
+def read_tracking_rows(csv_path):
+    """Read a tracking CSV into dicts (empty list if missing)"""
+    if not os.path.exists(csv_path):
+        return []
+    
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def estimate_seconds_per_company(timestamps, max_gap=15 * 60):
+    """Median gap between finished companies in past runs (None without history)
+    
+    Gaps longer than max_gap are treated as breaks between runs. Because it
+    measures completions, the estimate already reflects past concurrency.
+    """
+    times = sorted(timestamps)
+    gaps = [b - a for a, b in zip(times, times[1:]) if 0 <= b - a <= max_gap]
+    
+    if not gaps:
+        return None
+    
+    return statistics.median(gaps)
+
+
+class CostModel:
+    """Predict how many result pages a company will take, for LPT scheduling
+    
+    Companies seen in earlier runs use their logged total_pages (1 for "no
+    results"). Others get a title heuristic - fewer distinctive words and more
+    generic ones mean more pages - scaled to match the history.
+    """
+    
+    def __init__(self, processed_rows=(), unprocessed_rows=()):
+        self.known = {}
+        for row in unprocessed_rows:
+            self.known[row['company_name']] = 1.0
+        for row in processed_rows:
+            if row.get('truncated') == '1':
+                # A partial save's page count says when the budget ran out, not what it costs
+                continue
+            try:
+                self.known[row['company_name']] = max(1.0, float(row['total_pages']))
+            except (KeyError, TypeError, ValueError):
+                continue
         
-        logger.info(f"✅ COMPLETE: {page_count} pages, {len(self.all_results)} total results")
+        ratios = [pages / self.heuristic(name) for name, pages in self.known.items()]
+        self.scale = statistics.median(ratios) if ratios else 1.0
+        self.predicted = {}
+        self.actual = {}
+    
+    @staticmethod
+    def heuristic(company_name):
+        words = normalize_title(company_name).split()
+        generic = sum(word in GENERIC_WORDS for word in words)
+        specific = len(words) - generic
         
-        return self.all_results
+        pages = 20.0 / specific if specific else 50.0
+        return pages * (1 + generic)
     
-    def save_results(self, company_name):
-        """Save to CSV and upload to MinIO"""
+    def predict(self, company_name):
+        pages = self.known.get(company_name)
+        if pages is None:
+            pages = self.heuristic(company_name) * self.scale
         
-        if not self.all_results:
-            logger.warning("⚠️  No results to save")
-            return None
+        max_pages = PAGINATION_CONFIG.get('max_pages')
+        if max_pages:
+            pages = min(pages, max_pages)
         
-        clean_name = re.sub(r'[^\w\s-]', '', company_name).strip()
-        clean_name = re.sub(r'[-\s]+', '_', clean_name)
-        
-        csv_filename = f"{clean_name}.csv"
-        csv_path = os.path.join(COMPANY_DATA_DIR, csv_filename)
-        
-        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['page', 'result_on_page', 'company_name', 'location', 
-                         'company_url', 'officer_name', 'officer_url', 'officer_id', 'total_officers']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for result in self.all_results:
-                if result['officers']:
-                    for officer in result['officers']:
-                        writer.writerow({
-                            'page': result['page'],
-                            'result_on_page': result['result_on_page'],
-                            'company_name': result['company_name'],
-                            'location': result['location'],
-                            'company_url': result['company_url'],
-                            'officer_name': officer['name'],
-                            'officer_url': officer['url'],
-                            'officer_id': officer['entity_id'],
-                            'total_officers': result['total_officers']
-                        })
-                else:
-                    writer.writerow({
-                        'page': result['page'],
-                        'result_on_page': result['result_on_page'],
-                        'company_name': result['company_name'],
-                        'location': result['location'],
-                        'company_url': result['company_url'],
-                        'officer_name': '',
-                        'officer_url': '',
-                        'officer_id': '',
-                        'total_officers': result['total_officers']
-                    })
+        self.predicted[company_name] = pages
+        return pages
+    
+    def order(self, companies):
+        """Longest-processing-time-first - most expensive companies start first"""
+        return sorted(companies, key=self.predict, reverse=True)
+    
+    def record(self, company_name, seconds, pages=None):
+        self.actual[company_name] = (seconds, pages)
+    
+    def summary_lines(self, top=5):
+        """Predicted vs actual cost for the run"""
+        done = [name for name in self.actual if name in self.predicted]
+        if not done:
+            return []
         
-        logger.info(f"💾 Saved company data: {csv_filename}")
+        predicted_pages = sum(self.predicted[name] for name in done)
+        actual_seconds = sum(self.actual[name][0] for name in done)
+        paged = [name for name in done if self.actual[name][1] is not None]
         
-        if self.minio_uploader:
-            self.minio_uploader.upload_file(csv_path, csv_filename)
+        lines = [f"{len(done)} companies: predicted {predicted_pages:.0f} pages, "
+                 f"took {actual_seconds/60:.1f} worker-minutes "
+                 f"({actual_seconds / max(predicted_pages, 1):.1f}s per predicted page)"]
         
-        return csv_path, csv_filename
-    
-    async def close(self):
-        """Cleanup"""
-        try:
-            if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
-        except:
-            pass
+        if paged:
+            actual_pages = sum(self.actual[name][1] for name in paged)
+            errors = [abs(self.predicted[name] - self.actual[name][1]) for name in paged]
+            lines.append(f"pages: predicted {sum(self.predicted[n] for n in paged):.0f}, "
+                         f"actual {actual_pages} (median error {statistics.median(errors):.1f} pages)")
+        
+        for name in sorted(done, key=lambda n: self.actual[n][0], reverse=True)[:top]:
+            seconds, pages = self.actual[name]
+            lines.append(f"{name}: predicted {self.predicted[name]:.0f} pages, "
+                         f"actual {'?' if pages is None else pages} pages in {seconds:.0f}s")
+        
+        return lines
 
 
-def read_companies_from_csv(csv_path):
-    """Read companies from CSV"""
-    companies = []
+def plan_run(input_csv, delta=False):
+    """Print the work breakdown and a time estimate without scraping anything
     
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                if 'title' in row and row['title']:
-                    companies.append(row['title'].strip())
-        
-        logger.info(f"📊 Loaded {len(companies)} companies from {csv_path}")
-        return companies
-        
-    except Exception as e:
-        logger.error(f"❌ Error reading CSV: {e}")
-        return []
+    With delta only new or renamed CIKs are planned, as in a --delta run
+    (nothing is recorded in the CIK set).
+    """
+    delta_counts = None
+    if delta:
+        cik_set = CikSet()
+        companies, _, delta_counts = diff_input(input_csv, cik_set,
+                                                set() if cik_set.loaded else tracked_done_titles())
+    else:
+        companies = read_companies_from_csv(input_csv)
+    if not companies:
+        print("✅ No new or renamed CIKs - nothing to scrape" if delta else "❌ No companies found")
+        return None
+    
+    processed_rows = read_tracking_rows(PROCESSED_CSV)
+    unprocessed_rows = read_tracking_rows(UNPROCESSED_CSV)
+    failed_rows = read_tracking_rows(FAILED_CSV)
+    
+    # A truncated save is not done yet - its checkpoint makes it resumable
+    processed = {row['company_name'] for row in processed_rows if row.get('truncated') != '1'}
+    unprocessed = {row['company_name'] for row in unprocessed_rows}
+    failed = {row['company_name'] for row in failed_rows}
+    
+    checkpointed = set()
+    if os.path.isdir(CHECKPOINT_DIR):
+        checkpointed = {name[:-len('.jsonl')] for name in os.listdir(CHECKPOINT_DIR) if name.endswith('.jsonl')}
+    
+    unique = list(dict.fromkeys(companies))
+    breakdown = {'done': 0, 'no_results': 0, 'retry': 0, 'resumable': 0, 'new': 0}
+    
+    for company_name in unique:
+        if company_name in processed:
+            breakdown['done'] += 1
+        elif company_name in unprocessed:
+            breakdown['no_results'] += 1
+        elif company_csv_filename(company_name)[:-4] in checkpointed:
+            breakdown['resumable'] += 1
+        elif company_name in failed:
+            breakdown['retry'] += 1
+        else:
+            breakdown['new'] += 1
+    
+    timestamps = []
+    for row in processed_rows + unprocessed_rows:
+        try:
+            timestamps.append(datetime.strptime(row['timestamp'], '%Y-%m-%d %H:%M:%S').timestamp())
+        except (KeyError, TypeError, ValueError):
+            continue
+    
+    per_company = estimate_seconds_per_company(timestamps)
+    history = per_company is not None
+    if not history:
+        per_company = 30.0
+    
+    # A run scrapes every unique company - local tracking is history, not a skip list
+    todo = len(unique)
+    estimate = per_company * todo
+    
+    print("\n" + "="*80)
+    print("📝 RUN PLAN (nothing will be scraped)")
+    print("="*80)
+    print(f"\n📥 Input: {input_csv}")
+    if delta_counts:
+        print(f"🆕 Delta: {delta_counts['new']} new, {delta_counts['renamed']} renamed, "
+              f"{delta_counts['unchanged'] + delta_counts['seeded']} unchanged CIKs (not planned)")
+    print(f"   Rows: {len(companies)} ({len(companies) - len(unique)} duplicates)")
+    print("\n🗒️  Local history (informational - these are scraped again):")
+    print(f"   ✅ Processed before:       {breakdown['done']}")
+    print(f"   ❌ No results before:      {breakdown['no_results']}")
+    print(f"   ♻️  Resumable (checkpoint): {breakdown['resumable']}")
+    print(f"   🔁 Failed before:          {breakdown['retry']}")
+    print(f"   🆕 Never seen:             {breakdown['new']}")
+    print(f"\n📋 To scrape: {todo}")
+    if OUTPUT_CONFIG.get('skip_existing_remote'):
+        print("   Companies already in MinIO are skipped when the run starts (not counted here)")
+    duration = f"{estimate/3600:.1f} hours" if estimate >= 3600 else f"{estimate/60:.1f} minutes"
+    print(f"⏱️  Estimate: ~{duration} "
+          f"({per_company:.1f}s per company{'' if history else ' - no history, using a default'})")
+    if history:
+        print(f"   Based on {len(timestamps)} past companies in the tracking files")
+    print()
+    
+    return breakdown
 
 
 async def scrape_company_fast(company_name, company_index, total_companies, 
-                            minio_uploader, tracking_csv):
-    """Scrape a single company - with tracking"""
+                            minio_uploader, tracking_csv, shard_writer=None,
+                            checkpoint_store=None, stop_event=None, retry_policy=None,
+                            breaker=None, scraper=None, parse_executor=None,
+                            extraction_stats=None, rate_limiter=None, pipeline=None,
+                            entity_store=None, account=None, run_deadline=None,
+                            profile_dir=None, cache_stats=None, summary=None):
+    """Scrape a single company - with tracking
+    
+    Pass a scraper to reuse its browser across companies; otherwise a
+    throwaway one is launched and closed for this company. With an account
+    the company is scraped in that account's session. Pagination stops at
+    run_deadline (time.monotonic) or after RUN_CONFIG['company_budget_s'].
+    With a pipeline the results are handed to its write/upload stages and
+    tracked once saved; without one they are saved before returning.
+    A summary dict receives the saved company's page and result counts.
+    Returns an Outcome, or a FailureKind if the company should be retried later.
+    """
     
     print(f"\n[{company_index}/{total_companies}] {company_name}")
     
-    scraper = FastCorporationWikiScraper(CREDENTIALS, minio_uploader)
+    owns_scraper = scraper is None
+    if owns_scraper:
+        scraper = FastCorporationWikiScraper(CREDENTIALS, checkpoint_store, stop_event, retry_policy,
+                                             breaker, parse_executor, extraction_stats, rate_limiter,
+                                             profile_dir, cache_stats)
     
     try:
-        await scraper.setup()
+        if account:
+            await scraper.use_account(account)
         
-        if not await scraper.search(company_name):
-            logger.error(f"❌ Search failed")
-            # No tracking for search failures - they go nowhere
-            return False
+        budget = RUN_CONFIG.get('company_budget_s')
+        deadlines = [d for d in (run_deadline, time.monotonic() + budget if budget else None) if d]
+        scraper.deadline = min(deadlines) if deadlines else None
+        scraper.truncated = False
         
-        results = await scraper.scrape_all_pages_fast()
+        results = []
+        queries = plan_queries(company_name)
         
-        if results:
-            csv_path, csv_filename = scraper.save_results(company_name)
+        resume = checkpoint_store.load(company_name) if checkpoint_store else None
+        if resume:
+            queries = [resume['query']]
+            logger.info(f"♻️  Resuming from checkpoint: {resume['last_page']} pages, "
+                        f"{len(resume['results'])} results")
+        
+        if resume and resume['done']:
+            # Pagination finished before the crash - only the save is missing
+            results = scraper.all_results = resume['results']
+            scraper.current_page = resume['last_page']
+        else:
+            await scraper.ensure_ready()
+        
+        for query in ([] if results else queries):
+            start_page = resume['last_page'] + 1 if resume else 1
             
-            total_officers = sum(len(r.get('officers', [])) for r in results)
+            if not await scraper.search(query, page=start_page):
+                logger.error(f"❌ Search failed")
+                # Not tracked yet - the retry lane picks it up
+                return scraper.last_failure or FailureKind.OTHER
             
-            print(f"✅ {len(results)} companies, {total_officers} officers, {scraper.current_page} pages")
+            if resume:
+                await scraper.handle_auth_if_needed()
+                scraper.last_failure = None
+                if not await scraper.seek_page(start_page):
+                    if not await scraper.reached_end():
+                        # A click failed on the way - the retry lane resumes from the checkpoint
+                        return scraper.last_failure or FailureKind.OTHER
+                    # Could not get past the checkpointed page - it was the last one
+                    results = scraper.all_results = resume['results']
+                    scraper.current_page = resume['last_page']
+                    break
+            elif checkpoint_store:
+                checkpoint_store.start(company_name, query)
             
-            # ✅ ONLY LOG TO PROCESSED_CSV IF WE HAVE RESULTS
-            tracking_csv.log_processed(
-                company_name=company_name,
-                total_companies=len(results),
-                total_pages=scraper.current_page,
-                total_officers=total_officers,
-                csv_filename=csv_filename
-            )
+            results = await scraper.scrape_all_pages_fast(query=query, checkpoint_key=company_name,
+                                                          resume=resume)
             
-            return True
+            if scraper.interrupted:
+                # Checkpoint stays on disk - the next run resumes from the next page
+                return Outcome.INTERRUPTED
+            
+            if scraper.truncated:
+                # Save what we have - the checkpoint stays open for the remainder
+                break
+            
+            failure = scraper.last_failure
+            if failure and (results or failure in FailureKind.TRANSIENT or query == queries[-1]):
+                # Checkpoint stays open - the retry resumes after the last good page
+                return failure
+            
+            if results:
+                break
+            
+            if query != queries[-1]:
+                logger.info(f"↩️  No results for '{query}' ({failure or 'empty'}) - trying a broader query")
+        
+        if results:
+            output = CompanyOutput(company_name, results, scraper.current_page, scraper.truncated)
+            if summary is not None:
+                summary.update(pages=output.total_pages, results=len(results))
+            
+            print(f"✅ {len(results)} companies, {output.total_officers} officers, {output.total_pages} pages"
+                  f"{' (truncated - remainder queued)' if output.truncated else ''}")
+            
+            if pipeline:
+                # Blocks while the write stage is backed up
+                await pipeline.submit(output)
+            else:
+                try:
+                    # Off the event loop - a full shard uploads here and would stall every worker
+                    await asyncio.to_thread(write_company_output, output, minio_uploader, shard_writer,
+                                            entity_store)
+                    await asyncio.to_thread(upload_company_output, output, minio_uploader, shard_writer)
+                except Exception as e:
+                    # The browser is fine - the retry resumes from the (done) checkpoint and only saves
+                    logger.error(f"❌ Save failed: {e}")
+                    return classify_error(e)
+                if not shard_writer:
+                    # Shard members are recorded by the shard writer once their shard is uploaded
+                    record_company_output(output, tracking_csv, checkpoint_store)
+            
+            return output.outcome
         else:
             logger.warning(f"⚠️  No results found")
             
             # 📝 ONLY LOG TO UNPROCESSED_CSV IF NO RESULTS
             tracking_csv.log_unprocessed(company_name)
             
-            return False
+            if checkpoint_store:
+                checkpoint_store.clear(company_name)
+            
+            return Outcome.NO_RESULTS
         
     except Exception as e:
         logger.error(f"❌ Error: {e}")
-        # No tracking for exceptions - they go nowhere
-        return False
+        # Not tracked yet - the retry lane picks it up
+        # A shared browser may be in a bad state - relaunch before the next company
+        scraper.needs_restart = True
+        return classify_error(e)
     finally:
-        await scraper.close()
+        if owns_scraper:
+            await scraper.close()
+        else:
+            scraper.context_companies += 1
+            scraper.browser_companies += 1
+
+
+def install_shutdown_handlers(stop_event=None):
+    """Turn SIGINT/SIGTERM into a stop event so in-flight work drains cleanly"""
+    stop_event = stop_event or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    
+    def request_stop(signame):
+        if stop_event.is_set():
+            logger.warning(f"⚠️  {signame} again - still draining, please wait")
+            return
+        logger.warning(f"🛑 {signame} received - finishing current page and flushing checkpoints")
+        stop_event.set()
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_stop, sig.name)
+        except (NotImplementedError, RuntimeError):
+            # Not supported on this platform (e.g. Windows) - default handling applies
+            pass
+    
+    return stop_event
+
+
+async def warm_up_browsers(workers, session_pool):
+    """Launch every worker's browser with its account session restored
+    
+    Returns (browsers ready, seconds taken). A browser that fails here is
+    relaunched before its first company.
+    """
+    started = time.monotonic()
+    
+    async def warm_up(index, scraper):
+        try:
+            await scraper.use_account(session_pool.accounts[index % len(session_pool.accounts)])
+            await scraper.ensure_ready()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️  Browser warm-up failed - relaunching on first company: {e}")
+            scraper.needs_restart = True
+            return False
+    
+    ready = await asyncio.gather(*(warm_up(index, scraper)
+                                   for index, (scraper, _) in enumerate(workers) if scraper))
+    return sum(ready), time.monotonic() - started
 
 
-async def main():
-    """Main - with tracking files in root directory"""
+async def main(options=None):
+    """Main - with tracking files in root directory
+    
+    options come from parse_args(); without them the run is interactive.
+    """
+    options = options or parse_args([])
     
     print("\n" + "="*80)
     print("CorporationWiki Fast Scraper - WITH COMPANY TRACKING (CORRECTED)")
     print("="*80)
+    print(f"\n⚙️  Profile: {options.profile} | concurrency {RUN_CONFIG['concurrency']} | "
+          f"engine {BROWSER_CONFIG['engine']} | parser {PARSE_CONFIG['parser']}")
     print(f"\n📁 Company data files: {COMPANY_DATA_DIR}")
     print(f"📊 Tracking files (ROOT):")
     print(f"   - {PROCESSED_CSV} (ONLY companies WITH results)")
     print(f"   - {UNPROCESSED_CSV} (ONLY companies with NO results)")
     
+    stats = {'successful': 0, 'no_results': 0, 'failed': 0, 'unsaved': 0, 'not_started': 0,
+             'attempts': 0}
+    
+    def report_exit(state):
+        """Final status for the launcher when this process ends before the run starts"""
+        if options.shard:
+            write_shard_status(options.shard[0], {'state': state, 'total': 0, 'stats': stats,
+                                                  'elapsed': 0})
+    
+    # Checked before anything is launched - there is nothing to clean up yet
+    accounts = load_accounts()
+    if not accounts:
+        report_exit('failed')
+        return
+    
     # Initialize tracking CSV handler
     tracking_csv = TrackingCSV()
     
+    # Run-wide helpers come first so the browsers can warm up during setup
+    checkpoint_store = CheckpointStore()
+    stop_event = asyncio.Event()
+    retry_policy = RetryPolicy(
+        max_attempts=RETRY_CONFIG['max_attempts'],
+        base_delay=RETRY_CONFIG['base_delay'],
+        max_delay=RETRY_CONFIG['max_delay']
+    )
+    breaker = CircuitBreaker(
+        threshold=RETRY_CONFIG['breaker_threshold'],
+        cooldown=RETRY_CONFIG['breaker_cooldown']
+    )
+    
+    parse_executor = None
+    if PARSE_CONFIG.get('workers'):
+        parse_executor = ProcessPoolExecutor(max_workers=PARSE_CONFIG['workers'], initializer=init_parse_worker)
+    
+    extraction_stats = ExtractionStats()
+    rate_limiter = RateLimiter(RUN_CONFIG.get('max_requests_per_second'))
+    if rate_limiter.interval:
+        print(f"🚦 Navigation capped at {RUN_CONFIG['max_requests_per_second']} pages/s")
+    if PAGINATION_CONFIG.get('prefetch_depth'):
+        print(f"📑 Prefetching {PAGINATION_CONFIG['prefetch_depth']} pages ahead")
+    session_pool = SessionPool(accounts, RUN_CONFIG.get('account_strategy', 'least_loaded'))
+    
+    cache_stats = CacheStats()
+    
+    # Profile per worker (and per process) - Chromium locks a profile to one instance
+    profile_dirs = []
+    for index in range(max(1, RUN_CONFIG.get('concurrency', 1))):
+        name = f"worker-{index + 1}"
+        if options.shard:
+            name = f"process-{options.shard[0] + 1}-{name}"
+        profile_dirs.append(os.path.join(PROFILE_DIR, name))
+    
+    # One (scraper, recycler) per concurrent worker - each worker owns a browser
+    workers = []
+    for profile_dir in profile_dirs:
+        if RECYCLE_CONFIG.get('reuse_browser'):
+            workers.append((
+                FastCorporationWikiScraper(CREDENTIALS, checkpoint_store, stop_event, retry_policy,
+                                           breaker, parse_executor, extraction_stats, rate_limiter,
+                                           profile_dir, cache_stats),
+                BrowserRecycler(RECYCLE_CONFIG)
+            ))
+        else:
+            workers.append((None, None))
+    
+    startup_started = time.monotonic()
+    
+    warmup = None
+    if BROWSER_CONFIG.get('warm_start') and RECYCLE_CONFIG.get('reuse_browser'):
+        # Browsers launch and restore sessions while MinIO connects and the input loads
+        warmup = asyncio.create_task(warm_up_browsers(workers, session_pool))
+    
+    cik_set = None
+    ciks_by_title = {}
+    
+    async def abort_startup(state='done'):
+        """Shut the warmed-up browsers down when the run ends before it starts"""
+        report_exit(state)
+        if cik_set is not None:
+            # Keeps the CIKs of companies skipped as already in MinIO
+            cik_set.save()
+        if warmup:
+            await warmup
+        for scraper, _ in workers:
+            if scraper:
+                await scraper.close()
+        if parse_executor:
+            parse_executor.shutdown()
+    
     # Setup MinIO
-    print("\n☁️  Connecting to MinIO...")
-    minio_uploader = MinIOUploader(MINIO_CONFIG)
+    minio_uploader = None
+    if OUTPUT_CONFIG.get('upload'):
+        print("\n☁️  Connecting to MinIO...")
+        minio_uploader = MinIOUploader(MINIO_CONFIG)
+        
+        if not await asyncio.to_thread(minio_uploader.connect):
+            if options.yes:
+                print("⚠️  MinIO failed. Continuing with local save only...")
+            else:
+                answer = await asyncio.to_thread(input, "⚠️  MinIO failed. Continue with local save only? (y/n): ")
+                if answer.strip().lower() != 'y':
+                    await abort_startup('failed')
+                    return
+            minio_uploader = None
+        else:
+            folder_path = MINIO_CONFIG.get('folder_path', '')
+            bucket_display = f"{MINIO_CONFIG['bucket_name']}/{folder_path}" if folder_path else MINIO_CONFIG['bucket_name']
+            print(f"✅ MinIO ready: {bucket_display}")
     
-    if not minio_uploader.connect():
-        print("⚠️  MinIO failed. Continue with local save only? (y/n): ", end='')
-        if input().strip().lower() != 'y':
-            return
-        minio_uploader = None
-    else:
-        folder_path = MINIO_CONFIG.get('folder_path', '')
-        bucket_display = f"{MINIO_CONFIG['bucket_name']}/{folder_path}" if folder_path else MINIO_CONFIG['bucket_name']
-        print(f"✅ MinIO ready: {bucket_display}")
+    shard_writer = None
+    if minio_uploader and OUTPUT_CONFIG.get('shard_mode'):
+        shard_writer = ShardWriter(
+            minio_uploader,
+            max_companies=OUTPUT_CONFIG['shard_max_companies'],
+            max_bytes=OUTPUT_CONFIG['shard_max_bytes'],
+            folder=OUTPUT_CONFIG['shard_folder'],
+            on_uploaded=lambda output: record_company_output(output, tracking_csv, checkpoint_store)
+        )
+        print(f"📦 Shard mode: up to {shard_writer.max_companies} companies per shard")
+    
+    remote_inventory = None
+    if minio_uploader and OUTPUT_CONFIG.get('skip_existing_remote'):
+        remote_inventory = RemoteInventory()
+        if options.inventory:
+            # Listed once by the launcher for all processes
+            loaded = await asyncio.to_thread(remote_inventory.load_file, options.inventory)
+        else:
+            print("\n☁️  Listing existing objects in MinIO...")
+            loaded = await asyncio.to_thread(remote_inventory.load, minio_uploader)
+        if not loaded:
+            remote_inventory = None
     
-    input_csv = input("\nEnter CSV file path: ").strip()
+    input_csv = options.input or (await asyncio.to_thread(input, "\nEnter CSV file path: ")).strip()
     
     if not os.path.exists(input_csv):
         print(f"❌ File not found: {input_csv}")
+        await abort_startup('failed')
         return
     
-    companies = read_companies_from_csv(input_csv)
+    if options.delta:
+        cik_set = CikSet()
+        # First delta run - count companies the tracking files already finished as scraped
+        seed_titles = set() if cik_set.loaded else tracked_done_titles()
+        companies, ciks_by_title, delta = await asyncio.to_thread(diff_input, input_csv, cik_set, seed_titles)
+        if delta['seeded']:
+            cik_set.save()
+        print(f"\n🆕 Delta vs {os.path.basename(cik_set.path)} ({len(cik_set)} CIKs): "
+              f"{delta['new']} new, {delta['renamed']} renamed, {delta['unchanged']} unchanged")
+        if delta['seeded']:
+            print(f"🌱 Recorded {delta['seeded']} CIKs already done in the tracking files")
+        if delta['no_cik']:
+            print(f"⚠️  {delta['no_cik']} rows without a usable cik_str - always scraped")
+    else:
+        companies = await asyncio.to_thread(read_companies_from_csv, input_csv)
+    input_ready = time.monotonic() - startup_started
+    
+    # One row per ticker/CIK repeats a title - two workers must never scrape it at once
+    # (ciks_by_title keeps every CIK of a title)
+    unique = list(dict.fromkeys(companies))
+    if len(unique) < len(companies):
+        print(f"\n🔂 Dropped {len(companies) - len(unique)} duplicate titles from the input")
+    companies = unique
     
     if not companies:
-        print("❌ No companies found")
+        print("✅ No new or renamed CIKs - nothing to scrape" if cik_set is not None else "❌ No companies found")
+        await abort_startup()
         return
     
+    shard = options.shard
+    if shard:
+        shard_index, shard_count = shard
+        companies = [name for name in companies if shard_of(name, shard_count) == shard_index]
+        print(f"\n🧮 Process shard {shard_index + 1}/{shard_count}: {len(companies)} companies")
+    
+    skipped = 0
+    if remote_inventory:
+        # An open checkpoint means the remote object is a truncated partial save
+        pending = [name for name in companies
+                   if not remote_inventory.contains(name) or checkpoint_store.exists(name)]
+        skipped = len(companies) - len(pending)
+        if cik_set is not None:
+            # Already saved remotely - done as far as the delta is concerned
+            for name in set(companies) - set(pending):
+                for cik in ciks_by_title.get(name, ()):
+                    cik_set.add(cik, name)
+        companies = pending
+        print(f"\n⏭️  Skipping {skipped} companies already in MinIO")
+        
+        if not companies:
+            print("✅ Nothing left to scrape")
+            await abort_startup()
+            return
+    
+    cost_model = None
+    if RUN_CONFIG.get('schedule') == 'lpt':
+        cost_model = CostModel(read_tracking_rows(PROCESSED_CSV), read_tracking_rows(UNPROCESSED_CSV))
+        companies = cost_model.order(companies)
+        known = sum(name in cost_model.known for name in companies)
+        print(f"\n📐 Longest-first schedule: {known} companies costed from past runs, "
+              f"{len(companies) - known} by title heuristic")
+    
     print(f"\n📋 Companies to scrape: {len(companies)}")
     print(f"📁 Company data output: {COMPANY_DATA_DIR}")
     print(f"📊 Tracking files:")
     print(f"   - {PROCESSED_CSV} (successful only)")
     print(f"   - {UNPROCESSED_CSV} (no results only)\n")
     
-    confirm = input("Start fast scraping? (y/n): ").strip().lower()
-    if confirm != 'y':
-        print("Cancelled")
-        return
+    if not options.yes:
+        confirm = (await asyncio.to_thread(input, "Start fast scraping? (y/n): ")).strip().lower()
+        if confirm != 'y':
+            print("Cancelled")
+            await abort_startup()
+            return
     
     print("\n🚀 FAST MODE ACTIVATED\n")
     print("="*80)
     
-    successful = 0
-    no_results = 0
-    failed = 0
-    start_time = time.time()
+    install_shutdown_handlers(stop_event)
     
-    for index, company_name in enumerate(companies, 1):
-        success = await scrape_company_fast(
-            company_name, 
-            index, 
-            len(companies), 
-            minio_uploader,
-            tracking_csv
+    if warmup:
+        warm, warm_seconds = await warmup
+        print(f"🔥 {warm}/{len(workers)} browsers ready in {warm_seconds:.1f}s "
+              f"(launched alongside setup - input ready after {input_ready:.1f}s)")
+    
+    if parse_executor:
+        print(f"🧩 Parsing on {PARSE_CONFIG['workers']} worker processes")
+    
+    if len(session_pool.accounts) > 1:
+        print(f"👥 Account pool: {len(session_pool.accounts)} accounts ({session_pool.strategy})")
+    
+    entity_store = None
+    if OUTPUT_CONFIG.get('entity_store'):
+        entity_store = EntityStore()
+        print(f"🗃️  Entity store: {entity_store.path} ({entity_store.count()} companies so far)")
+    
+    pipeline = None
+    if PIPELINE_CONFIG.get('enabled'):
+        pipeline = ResultPipeline(
+            minio_uploader, tracking_csv, shard_writer, checkpoint_store,
+            write_workers=PIPELINE_CONFIG['write_workers'],
+            upload_workers=PIPELINE_CONFIG['upload_workers'],
+            queue_size=PIPELINE_CONFIG['queue_size'],
+            entity_store=entity_store
         )
+        pipeline.start()
+        print(f"🏭 Pipeline: {PIPELINE_CONFIG['write_workers']} write / "
+              f"{PIPELINE_CONFIG['upload_workers']} upload workers, queues of {PIPELINE_CONFIG['queue_size']}")
+    
+    start_time = time.time()
+    
+    def report_status(state):
+        if shard:
+            write_shard_status(shard[0], {'state': state, 'total': len(companies), 'stats': stats,
+                                          'elapsed': time.time() - start_time})
+    
+    report_status('running')
+    
+    run_deadline = None
+    if RUN_CONFIG.get('run_budget_s'):
+        run_deadline = time.monotonic() + RUN_CONFIG['run_budget_s']
+    
+    def out_of_time():
+        return run_deadline is not None and time.monotonic() >= run_deadline
+    
+    async def run_pass(names):
+        """Scrape names with all workers
         
-        if success:
-            successful += 1
-        else:
-            # We don't know if it was "no results" or other failure
-            # But our tracking CSV will accurately reflect this
-            no_results += 1
+        Returns ([(name, failure_kind)] to retry, [names] truncated by a time budget).
+        """
+        queue = asyncio.Queue()
+        for index, company_name in enumerate(names, 1):
+            queue.put_nowait((index, company_name))
+        
+        failures = []
+        truncated = []
+        finished = 0
+        worker_done_at = []
+        
+        async def worker(scraper, recycler, profile_dir):
+            nonlocal finished
+            
+            while not stop_event.is_set() and not out_of_time():
+                try:
+                    index, company_name = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    worker_done_at.append(time.time())
+                    return
+                
+                if recycler:
+                    await recycler.before_company(scraper)
+                
+                company_started = time.time()
+                summary = {}
+                account = session_pool.acquire(preferred=scraper.account if scraper else None)
+                try:
+                    outcome = await scrape_company_fast(
+                        company_name, 
+                        index, 
+                        len(names), 
+                        minio_uploader,
+                        tracking_csv,
+                        shard_writer,
+                        checkpoint_store,
+                        stop_event,
+                        retry_policy,
+                        breaker,
+                        scraper,
+                        parse_executor,
+                        extraction_stats,
+                        rate_limiter,
+                        pipeline,
+                        entity_store,
+                        account,
+                        run_deadline,
+                        profile_dir,
+                        cache_stats,
+                        summary
+                    )
+                finally:
+                    session_pool.release(account)
+                
+                # Per-company summary - the per-page events are DEBUG (see LOG_CONFIG)
+                company_seconds = time.time() - company_started
+                logger.info("🏁 %s: %s in %.1fs", company_name, outcome, company_seconds,
+                            extra={'event': 'company', 'company': company_name, 'outcome': outcome,
+                                   'seconds': round(company_seconds, 2),
+                                   'pages': summary.get('pages'), 'results': summary.get('results')})
+                
+                if outcome == Outcome.INTERRUPTED:
+                    print(f"\n🛑 Stopped on signal - checkpoint kept for: {company_name}")
+                    return
+                
+                if cost_model and outcome in (Outcome.PROCESSED, Outcome.NO_RESULTS):
+                    pages = 1 if outcome == Outcome.NO_RESULTS else summary.get('pages')
+                    cost_model.record(company_name, time.time() - company_started, pages)
+                
+                if outcome == Outcome.PROCESSED:
+                    stats['successful'] += 1
+                elif outcome == Outcome.NO_RESULTS:
+                    stats['no_results'] += 1
+                elif outcome == Outcome.TRUNCATED:
+                    truncated.append(company_name)
+                else:
+                    # Transient or unclear failure - deferred to the retry lane
+                    failures.append((company_name, outcome))
+                
+                finished += 1
+                stats['attempts'] += 1
+                report_status('running')
+                
+                # Progress update
+                elapsed = time.time() - start_time
+                avg_time = elapsed / finished
+                remaining = len(names) - finished
+                est_remaining = avg_time * remaining
+                
+                if finished % 5 == 0 or finished == len(names):
+                    print(f"\n📊 Progress: {finished}/{len(names)} | ✅ {stats['successful']} | "
+                          f"❌ {stats['no_results']} | 🔁 {len(failures)} deferred | "
+                          f"⏱️  {elapsed/60:.1f}min elapsed | ~{est_remaining/60:.1f}min remaining")
+                    if pipeline:
+                        print(f"🏭 {pipeline.depth_line()}")
+                    print("="*80)
+        
+        await asyncio.gather(*(worker(scraper, recycler, profile_dir)
+                               for (scraper, recycler), profile_dir in zip(workers, profile_dirs)))
+        
+        if len(worker_done_at) > 1:
+            # The spread is the tail LPT scheduling tries to keep short
+            print(f"\n⏱️  Workers finished within {max(worker_done_at) - min(worker_done_at):.0f}s of each other")
+        
+        if stop_event.is_set():
+            print("\n🛑 Stopped on signal")
+        elif out_of_time() and not queue.empty():
+            # Not tracked anywhere - the next run picks them up as new
+            stats['not_started'] += queue.qsize()
+            print(f"\n⏰ Run time budget used up - {queue.qsize()} companies left for the next run")
+        
+        return failures, truncated
+    
+    deferred, truncated = await run_pass(companies)
+    
+    # Retry lane - failed companies get another go after the main pass
+    for lane_pass in range(1, RETRY_CONFIG['retry_lane_passes'] + 1):
+        if not deferred or stop_event.is_set() or out_of_time():
+            break
+        
+        print(f"\n🔁 Retry lane pass {lane_pass}: {len(deferred)} companies")
+        print("="*80)
+        
+        retry_names = [company_name for company_name, _ in deferred]
+        deferred, more_truncated = await run_pass(cost_model.order(retry_names) if cost_model else retry_names)
+        truncated += more_truncated
+    
+    # Remainder passes - truncated companies resume from their checkpoints
+    for remainder_pass in range(1, RUN_CONFIG.get('remainder_passes', 0) + 1):
+        if not truncated or stop_event.is_set() or out_of_time():
+            break
+        
+        if pipeline:
+            # The partial saves must land before the complete ones replace them
+            await pipeline.join()
         
-        # Progress update
-        elapsed = time.time() - start_time
-        avg_time = elapsed / index
-        remaining = len(companies) - index
-        est_remaining = avg_time * remaining
+        print(f"\n⏰ Remainder pass {remainder_pass}: {len(truncated)} truncated companies")
+        print("="*80)
         
-        if index % 5 == 0 or index == len(companies):
-            print(f"\n📊 Progress: {index}/{len(companies)} | ✅ {successful} | ❌ {no_results} | "
-                  f"⏱️  {elapsed/60:.1f}min elapsed | ~{est_remaining/60:.1f}min remaining")
-            print("="*80)
+        more_deferred, truncated = await run_pass(truncated)
+        deferred += more_deferred
+    
+    stats['truncated'] = len(truncated)
+    
+    if not stop_event.is_set():
+        for company_name, failure_kind in deferred:
+            if failure_kind == FailureKind.PARSE_EMPTY and not checkpoint_store.load(company_name):
+                # Consistently no results markup - treat it as a genuine "no results"
+                tracking_csv.log_unprocessed(company_name)
+                checkpoint_store.clear(company_name)
+                stats['no_results'] += 1
+            else:
+                tracking_csv.log_failed(company_name, failure_kind)
+                stats['failed'] += 1
+    
+    if pipeline:
+        # Browsers are done - let queued companies finish writing/uploading
+        print(f"\n🏭 Draining pipeline ({pipeline.depth_line()})...")
+        await pipeline.close()
+        
+        print("🏭 Pipeline stages:")
+        for line in pipeline.summary_lines():
+            print(f"   - {line}")
+        
+        # Not tracked - their checkpoints stay, so the next run only redoes the save
+        # (truncated companies were never counted as successful)
+        stats['successful'] -= sum(output.outcome == Outcome.PROCESSED for output, _ in pipeline.failed)
+        stats['unsaved'] = len(pipeline.failed)
+    
+    context_recycles = browser_recycles = 0
+    for scraper, recycler in workers:
+        if scraper:
+            await scraper.close()
+            context_recycles += recycler.context_recycles
+            browser_recycles += recycler.browser_recycles
+    
+    if RECYCLE_CONFIG.get('reuse_browser'):
+        print(f"\n♻️  Recycled {context_recycles} contexts, {browser_recycles} browsers")
+    
+    if parse_executor:
+        parse_executor.shutdown()
+    
+    print("\n👥 Accounts:")
+    for line in session_pool.summary_lines():
+        print(f"   - {line}")
+    
+    if cost_model and cost_model.actual:
+        print("\n📐 Predicted vs actual cost:")
+        for line in cost_model.summary_lines():
+            print(f"   - {line}")
+    
+    if cache_stats.summary_lines():
+        print("\n🗂️  Static assets (persistent profile HTTP cache):")
+        for line in cache_stats.summary_lines():
+            print(f"   - {line}")
+    
+    if extraction_stats.modes:
+        print("\n🔬 Extraction (bytes over CDP / time per page):")
+        for line in extraction_stats.summary_lines():
+            print(f"   - {line}")
+    
+    if shard_writer:
+        shard_writer.close()
+        stats['successful'] -= sum(output.outcome == Outcome.PROCESSED for output in shard_writer.unsaved)
+        stats['unsaved'] += len(shard_writer.unsaved)
+    
+    if entity_store:
+        total_entities = entity_store.count()
+        entity_store.close()
+        print(f"\n🗃️  Entity store: {total_entities} companies - {entity_store.new_entities} new, "
+              f"{entity_store.repeat_entities} repeats stored as references only")
+        if minio_uploader and not shard:
+            # Shared by all processes - the launcher uploads it once they are done
+            minio_uploader.upload_file(entity_store.path)
+    
+    if cik_set is not None:
+        # Only what the tracking files call finished - failed and truncated companies stay pending
+        done = tracked_done_titles()
+        for title, ciks in ciks_by_title.items():
+            if title in done:
+                for cik in ciks:
+                    cik_set.add(cik, title)
+        recorded = cik_set.save()
+        print(f"\n🆕 CIK set: {recorded} CIKs recorded this run, {len(cik_set)} in {cik_set.path}")
     
+    successful = stats['successful']
+    no_results = stats['no_results']
+    failed = stats['failed']
     total_time = time.time() - start_time
     
     print("\n" + "="*80)
     print("🎉 SCRAPING COMPLETE!")
     print("="*80)
     print(f"\nTotal companies processed: {len(companies)}")
+    if skipped:
+        print(f"⏭️  Companies skipped (already in MinIO): {skipped}")
     print(f"✅ Companies WITH results: {successful} (logged in processed_companies.csv)")
     print(f"❌ Companies with NO results: {no_results} (logged in unprocessed-companies.csv)")
+    if failed:
+        print(f"⚠️  Companies FAILED after retries: {failed} (logged in failed-companies.csv)")
+    if stats['truncated']:
+        print(f"⏰ Companies TRUNCATED by time budget: {stats['truncated']} "
+              f"(partial results saved, checkpoint kept for the next run)")
+    if stats['not_started']:
+        print(f"⏰ Companies NOT STARTED before the run budget ran out: {stats['not_started']}")
+    if stats['unsaved']:
+        print(f"⚠️  Companies scraped but NOT saved: {stats['unsaved']} (kept in {CHECKPOINT_DIR}/ for the next run)")
     print(f"⏱️  Total time: {total_time/60:.1f} minutes")
+    if extraction_stats.first_at:
+        # Measured from startup, so it includes MinIO/input setup and the confirm prompt
+        print(f"🏁 Time to first result: {extraction_stats.first_at - startup_started:.1f}s after startup")
     print(f"⚡ Average: {total_time/len(companies):.1f} seconds per company")
     print(f"\n📁 Company data CSV files: {COMPANY_DATA_DIR}")
     print(f"📊 Tracking files (ROOT):")
@@ -780,7 +4227,250 @@ async def main():
         print(f"☁️  MinIO: {bucket_display}")
     
     print()
+    
+    report_status('stopped' if stop_event.is_set() else 'done')
+
+
+def parse_args(argv=None):
+    """Command line options for the non-interactive entry point"""
+    parser = argparse.ArgumentParser(description="CorporationWiki bulk scraper")
+    parser.add_argument('--input', '-i',
+                        help="companies CSV (cik_str,title) - prompted for if omitted")
+    parser.add_argument('--profile', '-p', default='default', choices=sorted(RUN_PROFILES),
+                        help="named run profile (default: %(default)s)")
+    parser.add_argument('--config', '-c',
+                        help='JSON file with overrides, e.g. {"run": {"concurrency": 2}}')
+    parser.add_argument('--set', dest='overrides', action='append', default=[], metavar='SECTION.KEY=VALUE',
+                        help="override one setting, e.g. --set parse.workers=4 (repeatable)")
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help="no prompts - start right away, continue without MinIO if it fails")
+    parser.add_argument('--plan', action='store_true',
+                        help="only print the work breakdown and time estimate (no browser, no MinIO)")
+    parser.add_argument('--delta', action='store_true',
+                        help="only scrape CIKs that are new or renamed since the last --delta run")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="run N scraper processes, each with its own browser(s) (default: 1)")
+    parser.add_argument('--shard', type=parse_shard, help=argparse.SUPPRESS)
+    parser.add_argument('--inventory', help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def parse_shard(value):
+    """'K/N' (1-based, as passed by the launcher) -> (K - 1, N)"""
+    index, _, count = value.partition('/')
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected K/N, got {value}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {value} out of range")
+    return index - 1, count
+
+
+def configure(options):
+    """Apply the profile, then the config file, then --set overrides"""
+    apply_config_overrides(RUN_PROFILES[options.profile])
+    
+    if options.config:
+        with open(options.config, 'r', encoding='utf-8') as f:
+            apply_config_overrides(json.load(f))
+    
+    for override in options.overrides:
+        name, _, raw_value = override.partition('=')
+        section, _, key = name.partition('.')
+        if not key:
+            raise ValueError(f"Expected SECTION.KEY=VALUE, got: {override}")
+        
+        try:
+            value = json.loads(raw_value)
+        except ValueError:
+            # Plain strings don't need JSON quoting
+            value = raw_value
+        
+        apply_config_overrides({section: {key: value}})
+    
+    level = str(LOG_CONFIG.get('level', 'INFO')).upper()
+    if not isinstance(logging.getLevelName(level), int):
+        raise ValueError(f"Unknown log level: {LOG_CONFIG.get('level')}")
+    LOG_CONFIG['level'] = level
+    
+    if OUTPUT_CONFIG.get('format') == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        # Caught here rather than in the write stage of every company
+        raise ValueError("output.format=parquet requires the 'pyarrow' package")
+
+
+def sum_shard_stats(statuses):
+    totals = {}
+    for status in statuses:
+        if status:
+            for key, value in status['stats'].items():
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def launch_processes(options):
+    """Run options.processes scraper processes over crc32 shards of the input
+    
+    Each process is a normal run (own event loop, browsers and workers) on its
+    share of the companies; this one only shows their combined progress and
+    prints one summary at the end.
+    """
+    shard_count = options.processes
+    
+    input_csv = options.input or input("\nEnter CSV file path: ").strip()
+    if not os.path.exists(input_csv):
+        print(f"❌ File not found: {input_csv}")
+        return 1
+    
+    if options.delta:
+        # Same diff the processes will make - nothing is recorded here
+        cik_set = CikSet()
+        companies = diff_input(input_csv, cik_set, set() if cik_set.loaded else tracked_done_titles())[0]
+    else:
+        companies = read_companies_from_csv(input_csv)
+    
+    sizes = [0] * shard_count
+    for company_name in dict.fromkeys(companies):
+        sizes[shard_of(company_name, shard_count)] += 1
+    
+    print("\n" + "="*80)
+    print(f"CorporationWiki Fast Scraper - {shard_count} PROCESSES")
+    print("="*80)
+    print(f"\n🧮 Companies per process: {sizes}")
+    print(f"⚙️  Profile: {options.profile} | concurrency {RUN_CONFIG['concurrency']} per process")
+    
+    if not options.yes:
+        confirm = input("\nStart all processes? (y/n): ").strip().lower()
+        if confirm != 'y':
+            print("Cancelled")
+            return 0
+    
+    os.makedirs(SHARD_STATUS_DIR, exist_ok=True)
+    # Create/upgrade the shared tracking files before the processes race for them
+    TrackingCSV()
+    
+    # Shared artifacts are handled here once rather than by every process
+    minio_uploader = None
+    if OUTPUT_CONFIG.get('upload'):
+        minio_uploader = MinIOUploader(MINIO_CONFIG)
+        if not minio_uploader.connect():
+            minio_uploader = None
+    
+    inventory_path = None
+    if minio_uploader and OUTPUT_CONFIG.get('skip_existing_remote'):
+        print("\n☁️  Listing existing objects in MinIO...")
+        remote_inventory = RemoteInventory()
+        if remote_inventory.load(minio_uploader):
+            inventory_path = os.path.join(SHARD_STATUS_DIR, 'remote_inventory.txt')
+            remote_inventory.save(inventory_path)
+    
+    command = [sys.executable, os.path.abspath(__file__), '--input', input_csv,
+               '--profile', options.profile, '--yes']
+    if options.config:
+        command += ['--config', options.config]
+    if options.delta:
+        command += ['--delta']
+    if inventory_path:
+        command += ['--inventory', inventory_path]
+    for override in options.overrides:
+        command += ['--set', override]
+    
+    processes = []
+    for shard_index in range(shard_count):
+        try:
+            os.remove(os.path.join(SHARD_STATUS_DIR, f"shard-{shard_index}.json"))
+        except FileNotFoundError:
+            pass
+        
+        log = open(os.path.join(SHARD_STATUS_DIR, f"shard-{shard_index}.log"), 'w', encoding='utf-8')
+        proc = subprocess.Popen(command + ['--shard', f"{shard_index + 1}/{shard_count}"],
+                                stdout=log, stderr=subprocess.STDOUT)
+        processes.append((proc, log))
+    
+    print(f"\n🚀 Started {shard_count} processes - logs in {SHARD_STATUS_DIR}/shard-N.log")
+    start_time = time.time()
+    
+    try:
+        while any(proc.poll() is None for proc, _ in processes):
+            time.sleep(10)
+            
+            statuses = [read_shard_status(i) for i in range(shard_count)]
+            totals = sum_shard_stats(statuses)
+            total = sum(status['total'] for status in statuses if status)
+            running = sum(proc.poll() is None for proc, _ in processes)
+            
+            print(f"📊 Progress: {totals.get('attempts', 0)}/{total} | ✅ {totals.get('successful', 0)} | "
+                  f"❌ {totals.get('no_results', 0)} | ⚠️  {totals.get('failed', 0)} failed | "
+                  f"⏱️  {(time.time() - start_time)/60:.1f}min | {running}/{shard_count} processes running")
+    except KeyboardInterrupt:
+        # The processes got the same Ctrl+C - let them checkpoint and exit
+        print("\n🛑 Waiting for processes to checkpoint and exit...")
+        for proc, _ in processes:
+            proc.wait()
+    
+    for _, log in processes:
+        log.close()
+    
+    if minio_uploader and OUTPUT_CONFIG.get('entity_store') and os.path.exists(ENTITY_STORE_DB):
+        minio_uploader.upload_file(ENTITY_STORE_DB)
+    
+    statuses = [read_shard_status(i) for i in range(shard_count)]
+    totals = sum_shard_stats(statuses)
+    total_time = time.time() - start_time
+    
+    print("\n" + "="*80)
+    print("🎉 ALL PROCESSES FINISHED")
+    print("="*80)
+    for shard_index, ((proc, _), status) in enumerate(zip(processes, statuses)):
+        if status:
+            shard_stats = status['stats']
+            print(f"   - process {shard_index + 1}: {status['state']}, {status['total']} companies, "
+                  f"✅ {shard_stats['successful']} ❌ {shard_stats['no_results']} "
+                  f"⚠️  {shard_stats['failed']} (exit {proc.returncode})")
+        else:
+            print(f"   - process {shard_index + 1}: no status (exit {proc.returncode}) - "
+                  f"see shard-{shard_index}.log")
+    
+    print(f"\nTotal companies: {sum(status['total'] for status in statuses if status)}")
+    print(f"✅ Companies WITH results: {totals.get('successful', 0)}")
+    print(f"❌ Companies with NO results: {totals.get('no_results', 0)}")
+    print(f"⚠️  Companies FAILED after retries: {totals.get('failed', 0)}")
+    if totals.get('truncated'):
+        print(f"⏰ Companies TRUNCATED by time budget: {totals['truncated']}")
+    if totals.get('not_started'):
+        print(f"⏰ Companies NOT STARTED before the run budget ran out: {totals['not_started']}")
+    print(f"⏱️  Total time: {total_time/60:.1f} minutes")
+    print()
+    
+    return max(proc.returncode for proc, _ in processes)
+
+
+def run_cli(argv=None):
+    """Parse options, apply the run profile and run the scraper"""
+    options = parse_args(argv)
+    
+    try:
+        configure(options)
+    except (ValueError, OSError) as e:
+        print(f"❌ Invalid configuration: {e}")
+        return 2
+    
+    setup_logging()
+    
+    if options.plan:
+        input_csv = options.input or input("\nEnter CSV file path: ").strip()
+        if not os.path.exists(input_csv):
+            print(f"❌ File not found: {input_csv}")
+            return 1
+        plan_run(input_csv, options.delta)
+        return 0
+    
+    if options.processes > 1 and not options.shard:
+        return launch_processes(options)
+    
+    asyncio.run(main(options))
+    return 0
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    raise SystemExit(run_cli())
\ No newline at end of file
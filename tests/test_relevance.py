@@ -0,0 +1,23 @@
+"""The difflib fallback must score like rapidfuzz's token_set_ratio"""
+
+import pytest
+
+from corpwikiscrap import token_set_ratio
+
+
+def tokens(name):
+    return set(name.lower().split())
+
+
+@pytest.mark.parametrize('query, name, expected', [
+    ('FIRST BANCORP', 'First Bancorp of Indiana Inc', 100.0),
+    ('WELLS FARGO', 'Wells Real Estate Fund', 62.5),
+    ('BANK OF AMERICA', 'America First Bank', 88.9),
+    ('ALPHABET', 'Alpha Bet Co', 80.0),
+])
+def test_matches_rapidfuzz(query, name, expected):
+    assert token_set_ratio(tokens(query), tokens(name)) == pytest.approx(expected, abs=0.1)
+
+
+def test_empty_name_scores_zero():
+    assert token_set_ratio(tokens('ACME'), set()) == 0.0
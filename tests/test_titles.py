@@ -0,0 +1,26 @@
+"""Title normalization - SEC jurisdiction tags must not reach the search query"""
+
+import pytest
+
+from corpwikiscrap import normalize_title, plan_queries
+
+
+@pytest.mark.parametrize('title, expected', [
+    ('APPLE INC /DE/', 'APPLE'),
+    ('EXXON MOBIL CORP/DE/', 'EXXON MOBIL'),
+    ('WELLS FARGO & COMPANY/MN', 'WELLS FARGO &'),
+    ('WELLS FARGO & COMPANY /MN', 'WELLS FARGO &'),
+    ('ACME WIDGETS INC\\DE\\', 'ACME WIDGETS'),
+    ('ACME WIDGETS INC \\NV\\', 'ACME WIDGETS'),
+])
+def test_jurisdiction_tags_are_dropped(title, expected):
+    assert normalize_title(title) == expected
+
+
+def test_slash_inside_a_name_is_kept():
+    assert normalize_title('NOVO NORDISK A/S') == 'NOVO NORDISK A S'
+    assert normalize_title('BANK OF NEW YORK/MELLON CORP') == 'BANK OF NEW YORK MELLON'
+
+
+def test_unsuffixed_query_keeps_the_legal_suffix_but_not_the_tag():
+    assert plan_queries('WELLS FARGO & COMPANY/MN')[:2] == ['WELLS FARGO &', 'WELLS FARGO & COMPANY']